@@ -0,0 +1,80 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokedex.legality import MAX_GENERATION, LegalityEngine
+from pokedex.movecatalog import load_pokedex
+
+# Builds a random corpus of Showdown teams from an extracted pokedex (mostly
+# legal sets, with a share of moves and abilities taken from other species)
+# and measures single checks and whole-team validation, serially and in a
+# process pool.
+
+
+def random_team(entries, rng, illegal_rate):
+    lines = []
+    for entry in rng.sample(entries, min(6, len(entries))):
+        moves = list(entry.get("moves") or {})
+        abilities = entry.get("abilities") or []
+        if isinstance(abilities, dict):
+            abilities = [a for form_abilities in abilities.values() for a in form_abilities]
+        lines.append(f"{entry['name']} @ Leftovers")
+        if abilities:
+            lines.append(f"Ability: {rng.choice(abilities)}")
+        picked = rng.sample(moves, min(4, len(moves)))
+        if picked and rng.random() < illegal_rate:
+            other = rng.choice(entries)
+            picked[-1] = rng.choice(list(other.get("moves") or {}) or picked)
+        lines.extend(f"- {move}" for move in picked)
+        lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the legality engine on a generated corpus of teams")
+    parser.add_argument("pokedex", help="extracted pokedex (extendedextractor.py output)")
+    parser.add_argument("--teams", type=int, default=10000, help="number of teams to generate")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="processes for the pool measurement")
+    parser.add_argument("--illegal-rate", type=float, default=0.2, help="share of sets given a move from another species")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    entries = load_pokedex(args.pokedex)
+    rng = random.Random(args.seed)
+
+    start = time.perf_counter()
+    engine = LegalityEngine.compile(entries)
+    compile_time = time.perf_counter() - start
+
+    checks = [(entry["name"], move) for entry in entries for move in (entry.get("moves") or {})]
+    checks = [rng.choice(checks) for _ in range(100000)] if checks else []
+    start = time.perf_counter()
+    for species, move in checks:
+        engine.can_learn(species, move, MAX_GENERATION)
+    check_time = (time.perf_counter() - start) / max(len(checks), 1)
+
+    teams = [random_team(entries, rng, args.illegal_rate) for _ in range(args.teams)]
+    results = {"entries": len(entries), "teams": len(teams), "compile_seconds": compile_time, "check_microseconds": check_time * 1e6}
+    for workers in (0, args.workers):
+        start = time.perf_counter()
+        validated = engine.validate_teams(teams, workers=workers)
+        elapsed = time.perf_counter() - start
+        results[f"teams_per_second_workers_{workers}"] = len(teams) / elapsed
+        results["illegal_teams"] = sum(1 for problems in validated if problems)
+
+    for key, value in results.items():
+        print(f"{key:<32} {value:>12.2f}" if isinstance(value, float) else f"{key:<32} {value:>12}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import argparse
+import glob
+import json
+import os
+import re
+import sys
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokedex.extendedextractor import parse_moves_page, parse_pokemon_page
+from pokedex.httpcache import HttpCache
+from pokedex.parsing import available_backends, get_pokemon_list
+from pokedex.transport import read_archive
+
+# Measures pages per second for every installed parsing backend, with full
+# and partial (region-only) parsing, on saved pages. Pages come from a
+# directory of fixtures named like the fetched URLs
+# (pokedex_all.html, bulbasaur.html, bulbasaur_moves_9.html), the extractors'
+# HTTP cache directory or a --record archive. Only recordings of the real
+# site say anything about partial parsing: it pays off on full-size pages.
+
+PARSERS = {
+    "index": lambda html, backend, partial: get_pokemon_list(html, backend, partial),
+    "species": lambda html, backend, partial: parse_pokemon_page(html, "", backend, partial),
+    "moves": lambda html, backend, partial: parse_moves_page(html, 1, backend, partial),
+}
+
+
+def page_type(name):
+    if re.search(r"pokedex[/_]all", name):
+        return "index"
+    if re.search(r"moves[/_]\d", name):
+        return "moves"
+    return "species"
+
+
+def load_pages(path):
+    pages = {"index": [], "species": [], "moves": []}
+    if zipfile.is_zipfile(path):
+        for response in read_archive(path):
+            if "pokemondb.net/pokedex/" in response.url and response.status_code == 200:
+                pages[page_type(response.url)].append(response.text)
+    elif os.path.isdir(os.path.join(path, "index")):
+        cache = HttpCache(path)
+        for index_file in glob.glob(os.path.join(path, "index", "*", "*.json")):
+            with open(index_file) as f:
+                entry = json.load(f)
+            if "pokemondb.net/pokedex/" in entry["url"] and entry["status"] == 200:
+                html = cache.read_body(entry).decode(entry["encoding"] or "utf-8", errors="replace")
+                pages[page_type(entry["url"])].append(html)
+    else:
+        for filename in sorted(glob.glob(os.path.join(path, "*.html"))):
+            if os.path.basename(filename).startswith("bulbapedia_"):
+                continue
+            with open(filename, encoding="utf-8") as f:
+                pages[page_type(os.path.basename(filename))].append(f.read())
+    return pages
+
+
+def pages_per_second(parse, pages, backend, partial, min_time):
+    count = 0
+    start = time.perf_counter()
+    while True:
+        for html in pages:
+            parse(html, backend, partial)
+        count += len(pages)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the HTML parsing backends on saved pages")
+    parser.add_argument("pages", help="fixture directory, HTTP cache directory or --record archive")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds to spend on each measurement")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    pages = load_pages(args.pages)
+    if os.path.exists(os.path.join(args.pages, "SYNTHETIC")):
+        print("Warning: these fixtures are hand-built stand-ins, not recordings of the real site.\n", file=sys.stderr)
+    results = []
+    print(f"{'page':<8} {'backend':<12} {'mode':<8} {'pages/s':>10}")
+    for kind, kind_pages in pages.items():
+        if not kind_pages:
+            continue
+        for backend in available_backends():
+            for partial in (False, True):
+                rate = pages_per_second(PARSERS[kind], kind_pages, backend, partial, args.min_time)
+                mode = "partial" if partial else "full"
+                results.append({"page": kind, "backend": backend, "mode": mode, "pages": len(kind_pages), "pages_per_second": rate})
+                print(f"{kind:<8} {backend:<12} {mode:<8} {rate:>10.1f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
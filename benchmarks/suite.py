@@ -0,0 +1,332 @@
+import argparse
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pokedex import cli, extractor
+from pokedex.extendedextractor import get_base_name, get_moves_from_table, parse_pokemon_page, sanitize_name
+from pokedex.fetch import Response
+from pokedex.hotfix import rename_abilities
+from pokedex.httpcache import HttpCache
+from pokedex.item import parse_items_page
+from pokedex.minify import minify_json
+from pokedex.parsing import get_evolutions, get_pokemon_list, make_soup
+from pokedex.transport import read_archive
+
+# Offline benchmarks on the saved pages in benchmarks/fixtures: every parser on
+# its own, the extract/items/build commands end to end against a local stub
+# server that serves the fixtures in place of pokemondb.net and Bulbapedia,
+# and the hotfix and minify passes. Results are written as JSON so two runs can
+# be compared with --compare.
+#
+# Fixtures are named after the URLs they stand for (pokedex_all.html,
+# bulbasaur.html, bulbasaur_moves_9.html, bulbapedia_<page>.html). --record
+# replaces them with the pages of a real run: a `pokedex build --record run.zip`
+# archive or an extractor's .http_cache.
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+# Present while the fixtures are hand-built stand-ins; --record removes it.
+SYNTHETIC_MARKER = os.path.join(FIXTURES, "SYNTHETIC")
+
+
+def fixture_name(url):
+    # The fixture file for a pokemondb.net or Bulbapedia url (any scheme or
+    # host prefix, so it also takes the paths the stub server receives).
+    match = re.search(r"pokemondb\.net/pokedex/all$", url)
+    if match:
+        return "pokedex_all.html"
+    match = re.search(r"pokemondb\.net/pokedex/([^/]+)/moves/(\d)$", url)
+    if match:
+        return f"{match[1]}_moves_{match[2]}.html"
+    match = re.search(r"pokemondb\.net/pokedex/([^/]+)$", url)
+    if match:
+        return f"{match[1]}.html"
+    match = re.search(r"bulbapedia\.bulbagarden\.net/wiki/(.+)$", url)
+    if match:
+        return f"bulbapedia_{unquote(match[1])}.html"
+    return None
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+####################
+##  STUB SERVER   ##
+####################
+class FixtureHandler(BaseHTTPRequestHandler):
+    # Serves /{host}/{path} (the Fetcher's --base-url layout) from the fixtures,
+    # with ETags so a second run with a cache sees 304s like the real sites send.
+    def do_GET(self):
+        name = fixture_name(self.path)
+        path = os.path.join(FIXTURES, name) if name else None
+        if not path or not os.path.exists(path):
+            self.send_response(404)
+            self.end_headers()
+            return
+        body = read_fixture(name)
+        etag = '"%s"' % hashlib.md5(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextlib.contextmanager
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FixtureHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class FixtureFetcher:
+    # Fetcher.get() over the fixtures, for extractor.get_pokemon_details.
+    def get(self, url):
+        name = fixture_name(url)
+        if name and os.path.exists(os.path.join(FIXTURES, name)):
+            return Response(url, 200, read_fixture(name))
+        return Response(url, 404, b"")
+
+
+####################
+##   MEASURING    ##
+####################
+def per_second(func, inputs, min_time):
+    # Calls of func per second over the inputs, repeated for at least min_time seconds.
+    count = 0
+    start = time.perf_counter()
+    while True:
+        for args in inputs:
+            func(*args)
+        count += len(inputs)
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return count / elapsed
+
+
+def best_time(func, repeat):
+    # Fastest of repeat runs, in seconds; output is swallowed.
+    times = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def load_fixtures():
+    pages = {"index": [], "species": [], "moves": [], "items": []}
+    for filename in sorted(glob.glob(os.path.join(FIXTURES, "*.html"))):
+        name = os.path.basename(filename)
+        with open(filename, encoding="utf-8") as f:
+            html = f.read()
+        if name.startswith("bulbapedia_"):
+            generation = re.search(r"Generation_([IVX]+)", name)[1]
+            pages["items"].append((html, generation))
+        elif name == "pokedex_all.html":
+            pages["index"].append((name, html))
+        elif re.search(r"_moves_\d\.html$", name):
+            pages["moves"].append((name, html))
+        else:
+            pages["species"].append((name, html))
+    return pages
+
+
+def parser_benchmarks(min_time):
+    pages = load_fixtures()
+    move_tables = []
+    for name, html in pages["moves"]:
+        gen = int(name[-6])
+        move_tables.extend((table, gen) for table in make_soup(html, "moves").find_all("table", class_="data-table"))
+    species_soups = [(make_soup(html, "species"),) for _, html in pages["species"]]
+    fetcher = FixtureFetcher()
+    species_urls = [(fetcher, "https://pokemondb.net/pokedex/" + name[:-5]) for name, _ in pages["species"]]
+
+    return [
+        ("parse.get_pokemon_list", "pages/s", per_second(get_pokemon_list, [(html,) for _, html in pages["index"]], min_time)),
+        ("parse.get_moves_from_table", "tables/s", per_second(get_moves_from_table, move_tables, min_time)),
+        ("parse.parse_pokemon_page", "pages/s", per_second(parse_pokemon_page, [(html, name) for name, html in pages["species"]], min_time)),
+        ("parse.get_pokemon_details", "pages/s", per_second(extractor.get_pokemon_details, species_urls, min_time)),
+        ("parse.get_evolutions", "pages/s", per_second(get_evolutions, species_soups, min_time)),
+        ("parse.parse_items_page", "pages/s", per_second(parse_items_page, pages["items"], min_time)),
+    ]
+
+
+def fixture_dex_range():
+    # The --dex range of the species that have fixtures, so the end-to-end runs
+    # do not ask the stub for the hundreds of species a recording leaves out.
+    numbers = [pokemon["dex_number"] for pokemon in get_pokemon_list(read_fixture("pokedex_all.html").decode("utf-8"))
+               if os.path.exists(os.path.join(FIXTURES, sanitize_name(get_base_name(pokemon["name"])) + ".html"))]
+    return f"{min(numbers)}-{max(numbers)}"
+
+
+def pipeline_benchmarks(repeat, workdir):
+    results = []
+    dex = ["--dex", fixture_dex_range()]
+    with stub_server() as base_url:
+        fetch_args = ["--base-url", base_url, "--rate", "0"]
+
+        def run(*argv):
+            return lambda: cli.main(list(argv))
+
+        def run_in(directory, *argv):
+            # extract-basic spools into the working directory.
+            def go():
+                cwd = os.getcwd()
+                os.chdir(directory)
+                try:
+                    cli.main(list(argv))
+                finally:
+                    os.chdir(cwd)
+            return go
+
+        out = lambda name: os.path.join(workdir, name)
+        journal = ["--journal", out("journal.jsonl")]
+        results.append(("e2e.extract", "s", best_time(run("extract", *fetch_args, *dex, "--no-cache", *journal, "--output", out("pokemon_data.json")), repeat)))
+        results.append(("e2e.extract_basic", "s", best_time(run_in(workdir, "extract-basic", "--base-url", base_url, *dex, "--no-cache", "--output", out("basic.json")), repeat)))
+        results.append(("e2e.items", "s", best_time(run("items", *fetch_args, "--no-cache", "--output", out("items.json")), repeat)))
+        results.append(("e2e.build", "s", best_time(run("build", *fetch_args, *dex, "--no-cache", *journal, "--output", out("pokedex.json"), "--also", "minified:" + out("minified_pokedex.json"), "--items-output", out("items.json")), repeat)))
+
+        # A warm cache: every page comes back as a 304 from the stub.
+        cached = [*fetch_args, *dex, "--cache-dir", out("http_cache"), *journal, "--output", out("cached.json")]
+        best_time(run("extract", *cached), 1)
+        results.append(("e2e.extract_cached", "s", best_time(run("extract", *cached), repeat)))
+
+    def hotfix():
+        shutil.copyfile(out("pokemon_data.json"), out("hotfix.json"))
+        rename_abilities(out("hotfix.json"))
+
+    results.append(("pass.hotfix", "s", best_time(hotfix, repeat)))
+    results.append(("pass.minify", "s", best_time(lambda: minify_json(out("pokedex.json"), out("minified.json")), repeat)))
+    return results
+
+
+def recorded_pages(path):
+    # (url, body) of every 200 in a --record archive or an HTTP cache directory.
+    if zipfile.is_zipfile(path):
+        for response in read_archive(path):
+            if response.status_code == 200:
+                yield response.url, response.content
+        return
+    cache = HttpCache(path)
+    for index_file in glob.glob(os.path.join(path, "index", "*", "*.json")):
+        with open(index_file) as f:
+            entry = json.load(f)
+        if entry["status"] == 200:
+            yield entry["url"], cache.read_body(entry)
+
+
+def record(path):
+    # Replace the fixtures with the pages of a real extractor run.
+    pages = {}
+    for url, body in recorded_pages(path):
+        name = fixture_name(url)
+        if name:
+            pages[name] = body
+    if "pokedex_all.html" not in pages:
+        raise SystemExit(f"{path} has no /pokedex/all page; record an extract or build run")
+    for filename in glob.glob(os.path.join(FIXTURES, "*.html")):
+        os.remove(filename)
+    for name, body in pages.items():
+        with open(os.path.join(FIXTURES, name), "wb") as f:
+            f.write(body)
+    if os.path.exists(SYNTHETIC_MARKER):
+        os.remove(SYNTHETIC_MARKER)
+    print(f"Recorded {len(pages)} fixtures from {path}")
+
+
+def warn_if_synthetic():
+    if os.path.exists(SYNTHETIC_MARKER):
+        print("Warning: benchmarks/fixtures holds hand-built stand-in pages, not recordings of the real site.\n"
+              "Parser timings on them say little; refresh them with --record run.zip first.\n", file=sys.stderr)
+
+
+def environment():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, cwd=FIXTURES).stdout.strip()
+    except OSError:
+        commit = ""
+    return {"commit": commit or None, "python": platform.python_version(), "platform": platform.platform(), "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+def compare(results, baseline_path):
+    with open(baseline_path) as f:
+        baseline = {result["name"]: result for result in json.load(f)["results"]}
+    print(f"\n{'benchmark':<32} {'baseline':>12} {'now':>12} {'change':>8}")
+    for result in results:
+        old = baseline.get(result["name"])
+        if not old:
+            continue
+        # Rates are better when higher, timings when lower; "change" is positive when faster.
+        ratio = result["value"] / old["value"] if result["unit"].endswith("/s") else old["value"] / result["value"]
+        print(f"{result['name']:<32} {old['value']:>12.3f} {result['value']:>12.3f} {(ratio - 1) * 100:>+7.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the parsers, the extract/items/build commands and the hotfix/minify passes on the saved fixtures")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds to spend on each parser measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="runs of each end-to-end measurement (the fastest counts)")
+    parser.add_argument("--only", choices=("parsers", "pipeline"), help="run one group of benchmarks")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="results file of an earlier run to compare against")
+    parser.add_argument("--record", metavar="PATH", help="replace the fixtures with the pages of a --record archive or an HTTP cache directory, and exit")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args.record)
+        return
+    warn_if_synthetic()
+
+    measured = []
+    if args.only != "pipeline":
+        measured += parser_benchmarks(args.min_time)
+    if args.only != "parsers":
+        with tempfile.TemporaryDirectory() as workdir:
+            measured += pipeline_benchmarks(args.repeat, workdir)
+
+    results = [{"name": name, "unit": unit, "value": value} for name, unit, value in measured]
+    print(f"{'benchmark':<32} {'value':>12} unit")
+    for result in results:
+        print(f"{result['name']:<32} {result['value']:>12.3f} {result['unit']}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=4)
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
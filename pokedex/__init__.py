@@ -0,0 +1,2 @@
+# Scrapers, converters and query tools for Pokédex data. The command line entry
+# point is pokedex.cli (installed as the `pokedex` script, or python -m pokedex).
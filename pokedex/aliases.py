@@ -0,0 +1,315 @@
+import re
+import unicodedata
+
+
+# pokemondb display name -> the name used in our output (Showdown's spelling).
+# Names that are not listed are kept as they are.
+CUSTOM_NAME_CHANGES = {
+    "Tauros (Combat Breed)": "Tauros-Paldea-Combat",
+    "Tauros (Blaze Breed)": "Tauros-Paldea-Blaze",
+    "Tauros (Aqua Breed)": "Tauros-Paldea-Aqua",
+    "Tatsugiri (Curly Form)": "Tatsugiri",
+    "Tatsugiri (Droopy Form)": "Tatsugiri-Droopy",
+    "Tatsugiri (Stretchy Form)": "Tatsugiri-Stretchy",
+    "Lycanroc (Midday Form)": "Lycanroc",
+    "Lycanroc (Dusk Form)": "Lycanroc-Dusk",
+    "Lycanroc (Midnight Form)": "Lycanroc-Midnight",
+    "Oricorio (Baile Style)": "Oricorio",
+    "Oricorio (Pom-Pom Style)": "Oricorio-Pom-Pom",
+    "Oricorio (Pa'u Style)": "Oricorio-Pa'u",
+    "Oricorio (Sensu Style)": "Oricorio-Sensu",
+    "Toxtricity (Amped Form)": "Toxtricity",
+    "Toxtricity (Low Key Form)": "Toxtricity-Low-Key",
+    "Maushold (Family of Three)": "Maushold",
+    "Maushold (Family of Four)": "Maushold-Four",
+    "Dudunsparce (Three-Segment Form)": "Dudunsparce-Three-Segment",
+    "Dudunsparce (Two-Segment Form)": "Dudunsparce",
+    "Flabébé": "Flabebe",
+    "Zoroark (Hisuian Zoroark)": "Zoroark-Hisui",
+    "Braviary (Hisuian Braviary)": "Braviary-Hisui",
+    "Arcanine (Hisuian Arcanine)": "Arcanine-Hisui",
+    "Avalugg (Hisuian Avalugg)": "Avalugg-Hisui",
+    "Decidueye (Hisuian Decidueye)": "Decidueye-Hisui",
+    "Electrode (Hisuian Electrode)": "Electrode-Hisui",
+    "Goodra (Hisuian Goodra)": "Goodra-Hisui",
+    "Growlithe (Hisuian Growlithe)": "Growlithe-Hisui",
+    "Lilligant (Hisuian Lilligant)": "Lilligant-Hisui",
+    "Qwilfish (Hisuian Qwilfish)": "Qwilfish-Hisui",
+    "Samurott (Hisuian Samurott)": "Samurott-Hisui",
+    "Sliggoo (Hisuian Sliggoo)": "Sliggoo-Hisui",
+    "Sneasel (Hisuian Sneasel)": "Sneasel-Hisui",
+    "Typhlosion (Hisuian Typhlosion)": "Typhlosion-Hisui",
+    "Voltorb (Hisuian Voltorb)": "Voltorb-Hisui",
+    "Zorua (Hisuian Zorua)": "Zorua-Hisui",
+    "Rotom (Heat Rotom)": "Rotom-Heat",
+    "Rotom (Mow Rotom)": "Rotom-Mow",
+    "Rotom (Fan Rotom)": "Rotom-Fan",
+    "Rotom (Frost Rotom)": "Rotom-Frost",
+    "Rotom (Wash Rotom)": "Rotom-Wash",
+    "Basculin (Red-Striped Form)": "Basculin",
+    "Basculin (Blue-Striped Form)": "Basculin-Blue-Striped",
+    "Basculin (White-Striped Form)": "Basculin-White-Striped",
+    "Indeedee (Male)": "Indeedee",
+    "Indeedee (Female)": "Indeedee-F",
+    "Squawkabilly (Green Plumage)": "Squawkabilly",
+    "Squawkabilly (Blue Plumage)": "Squawkabilly-Blue",
+    "Squawkabilly (Yellow Plumage)": "Squawkabilly-Yellow",
+    "Squawkabilly (White Plumage)": "Squawkabilly-White",
+    "Oinkologne (Female)": "Oinkologne-F",
+    "Oinkologne (Male)": "Oinkologne",
+    "Wooper (Paldean Wooper)": "Wooper-Paldea",
+    "Hoopa (Hoopa Confined)": "Hoopa",
+    "Hoopa (Hoopa Unbound)": "Hoopa-Unbound",
+    "Charizard (Mega Charizard X)": "Charizard-Mega-X",
+    "Charizard (Mega Charizard Y)": "Charizard-Mega-Y",
+    "Diancie (Mega Diancie)": "Diancie-Mega",
+    "Landorus (Incarnate Forme)": "Landorus",
+    "Landorus (Therian Forme)": "Landorus-Therian",
+    "Lopunny (Mega Lopunny)": "Lopunny-Mega",
+    "Scizor (Mega Scizor)": "Scizor-Mega",
+    "Swampert (Mega Swampert)": "Swampert-Mega",
+    "Tornadus (Incarnate Forme)": "Tornadus",
+    "Tornadus (Therian Forme)": "Tornadus-Therian",
+    "Urshifu (Single Strike Style)": "Urshifu",
+    "Urshifu (Rapid Strike Style)": "Urshifu-Rapid-Strike",
+    "Garchomp (Mega Garchomp)": "Garchomp-Mega",
+    "Mawile (Mega Mawile)": "Mawile-Mega",
+    "Medicham (Mega Medicham)": "Medicham-Mega",
+    "Pinsir (Mega Pinsir)": "Pinsir-Mega",
+    "Beedrill (Mega Beedrill)": "Beedrill-Mega",
+    "Gardevoir (Mega Gardevoir)": "Gardevoir-Mega",
+    "Gyarados (Mega Gyarados)": "Gyarados-Mega",
+    "Latios (Mega Latios)": "Latios-Mega",
+    "Latias (Mega Latias)": "Latias-Mega",
+    "Ninetales (Alolan Ninetales)": "Ninetales-Alola",
+    "Vulpix (Alolan Vulpix)": "Vulpix-Alola",
+    "Sableye (Mega Sableye)": "Sableye-Mega",
+    "Slowpoke (Galarian Slowpoke)": "Slowpoke-Galar",
+    "Slowbro (Mega Slowbro)": "Slowbro-Mega",
+    "Slowbro (Galarian Slowbro)": "Slowbro-Galar",
+    "Slowking (Galarian Slowking)": "Slowking-Galar",
+    "Tyranitar (Mega Tyranitar)": "Tyranitar-Mega",
+    "Venusaur (Mega Venusaur)": "Venusaur-Mega",
+    "Gallade (Mega Gallade)": "Gallade-Mega",
+    "Moltres (Galarian Moltres)": "Moltres-Galar",
+    "Zapdos (Galarian Zapdos)": "Zapdos-Galar",
+    "Articuno (Galarian Articuno)": "Articuno-Galar",
+    "Abomasnow (Mega Abomasnow)": "Abomasnow-Mega",
+    "Absol (Mega Absol)": "Absol-Mega",
+    "Aerodactyl (Mega Aerodactyl)": "Aerodactyl-Mega",
+    "Aggron (Mega Aggron)": "Aggron-Mega",
+    "Altaria (Mega Altaria)": "Altaria-Mega",
+    "Ampharos (Mega Ampharos)": "Ampharos-Mega",
+    "Audino (Mega Audino)": "Audino-Mega",
+    "Banette (Mega Banette)": "Banette-Mega",
+    "Camerupt (Mega Camerupt)": "Camerupt-Mega",
+    "Deoxys (Normal Forme)": "Deoxys",
+    "Deoxys (Attack Forme)": "Deoxys-Attack",
+    "Deoxys (Defense Forme)": "Deoxys-Defense",
+    "Deoxys (Speed Forme)": "Deoxys-Speed",
+    "Dugtrio (Alolan Dugtrio)": "Dugtrio-Alola",
+    "Exeggutor (Alolan Exeggutor)": "Exeggutor-Alola",
+    "Glalie (Mega Glalie)": "Glalie-Mega",
+    "Geodude (Alolan Geodude)": "Geodude-Alola",
+    "Graveler (Alolan Graveler)": "Graveler-Alola",
+    "Golem (Alolan Golem)": "Golem-Alola",
+    "Pumpkaboo (Average Size)": "Pumpkaboo",
+    "Pumpkaboo (Small Size)": "Pumpkaboo-Small",
+    "Pumpkaboo (Large Size)": "Pumpkaboo-Large",
+    "Pumpkaboo (Super Size)": "Pumpkaboo-Super",
+    "Gourgeist (Average Size)": "Gourgeist",
+    "Gourgeist (Small Size)": "Gourgeist-Small",
+    "Gourgeist (Large Size)": "Gourgeist-Large",
+    "Gourgeist (Super Size)": "Gourgeist-Super",
+    "Heracross (Mega Heracross)": "Heracross-Mega",
+    "Houndoom (Mega Houndoom)": "Houndoom-Mega",
+    "Keldeo (Ordinary Form)": "Keldeo",
+    "Keldeo (Resolute Form)": "Keldeo-Resolute",
+    "Manectric (Mega Manectric)": "Manectric-Mega",
+    "Marowak (Alolan Marowak)": "Marowak-Alola",
+    "Meowstic (Male)": "Meowstic",
+    "Meowstic (Female)": "Meowstic-F",
+    "Meowth (Alolan Meowth)": "Meowth-Alola",
+    "Meowth (Galarian Meowth)": "Meowth-Galar",
+    "Persian (Alolan Persian)": "Persian-Alola",
+    "Pidgeot (Mega Pidgeot)": "Pidgeot-Mega",
+    "Raichu (Alolan Raichu)": "Raichu-Alola",
+    "Ponyta (Galarian Ponyta)": "Ponyta-Galar",
+    "Rapidash (Galarian Rapidash)": "Rapidash-Galar",
+    "Rattata (Alolan Rattata)": "Rattata-Alola",
+    "Raticate (Alolan Raticate)": "Raticate-Alola",
+    "Sandshrew (Alolan Sandshrew)": "Sandshrew-Alola",
+    "Sceptile (Mega Sceptile)": "Sceptile-Mega",
+    "Sharpedo (Mega Sharpedo)": "Sharpedo-Mega",
+    "Steelix (Mega Steelix)": "Steelix-Mega",
+    "Stunfisk (Galarian Stunfisk)": "Stunfisk-Galar",
+    "Thundurus (Incarnate Forme)": "Thundurus",
+    "Thundurus (Therian Forme)": "Thundurus-Therian",
+    "Weezing (Galarian Weezing)": "Weezing-Galar",
+    "Burmy (Plant Cloak)": "Burmy",
+    "Burmy (Sandy Cloak)": "Burmy-Sandy",
+    "Burmy (Trash Cloak)": "Burmy-Trash",
+    "Wormadam (Plant Cloak)": "Wormadam",
+    "Wormadam (Sandy Cloak)": "Wormadam-Sandy",
+    "Wormadam (Trash Cloak)": "Wormadam-Trash",
+    "Zygarde (50% Forme)": "Zygarde",
+    "Zygarde (10% Forme)": "Zygarde-10%",
+    "Zygarde (Complete Forme)": "Zygarde-Complete",
+    "Linoone (Galarian Linoone)": "Linoone-Galar",
+    "Mr. Mime (Galarian Mr. Mime)": "Mr. Mime-Galar",
+    "Corsola (Galarian Corsola)": "Corsola-Galar",
+    "Darumaka (Galarian Darumaka)": "Darumaka-Galar",
+    "Diglett (Alolan Diglett)": "Diglett-Alola",
+    "Farfetch'd (Galarian Farfetch'd)": "Farfetch'd-Galar",
+    "Grimer (Alolan Grimer)": "Grimer-Alola",
+    "Nidoran♀": "Nidoran-F",
+    "Nidoran♂": "Nidoran-M",
+    "Yamask (Galarian Yamask)": "Yamask-Galar",
+    "Zigzagoon (Galarian Zigzagoon)": "Zigzagoon-Galar",
+    "Basculegion (Male)": "Basculegion",
+    "Basculegion (Female)": "Basculegion-F",
+    "Enamorus (Incarnate Forme)": "Enamorus",
+    "Enamorus (Therian Forme)": "Enamorus-Therian",
+    "Palafin (Zero Form)": "Palafin",
+    "Palafin (Hero Form)": "Palafin-Hero",
+    "Gimmighoul (Chest Form)": "Gimmighoul",
+    "Gimmighoul (Roaming Form)": "Gimmighoul-Roaming",
+    "Blastoise (Mega Blastoise)": "Blastoise-Mega",
+    "Alakazam (Mega Alakazam)": "Alakazam-Mega",
+    "Muk (Alolan Muk)": "Muk-Alola",
+    "Gengar (Mega Gengar)": "Gengar-Mega",
+    "Kangaskhan (Mega Kangaskhan)": "Kangaskhan-Mega",
+    "Eevee (Partner Eevee)": "Eevee",
+    "Mewtwo (Mega Mewtwo X)": "Mewtwo-Mega-X",
+    "Mewtwo (Mega Mewtwo Y)": "Mewtwo-Mega-Y",
+    "Blaziken (Mega Blaziken)": "Blaziken-Mega",
+    "Castform (Sunny Form)": "Castform-Sunny",
+    "Castform (Rainy Form)": "Castform-Rainy",
+    "Castform (Snowy Form)": "Castform-Snowy",
+    "Salamence (Mega Salamence)": "Salamence-Mega",
+    "Metagross (Mega Metagross)": "Metagross-Mega",
+    "Kyogre (Primal Kyogre)": "Kyogre-Primal",
+    "Groudon (Primal Groudon)": "Groudon-Primal",
+    "Rayquaza (Mega Rayquaza)": "Rayquaza-Mega",
+    "Lucario (Mega Lucario)": "Lucario-Mega",
+    "Dialga (Origin Forme)": "Dialga-Origin",
+    "Palkia (Origin Forme)": "Palkia-Origin",
+    "Giratina (Altered Forme)": "Giratina",
+    "Giratina (Origin Forme)": "Giratina-Origin",
+    "Shaymin (Land Forme)": "Shaymin",
+    "Shaymin (Sky Forme)": "Shaymin-Sky",
+    "Darmanitan (Standard Mode)": "Darmanitan",
+    "Darmanitan (Zen Mode)": "Darmanitan-Zen",
+    "Darmanitan (Galarian Standard Mode)": "Darmanitan-Galar",
+    "Darmanitan (Galarian Zen Mode)": "Darmanitan-Galar-Zen",
+    "Kyurem (White Kyurem)": "Kyurem-White",
+    "Kyurem (Black Kyurem)": "Kyurem-Black",
+    "Meloetta (Aria Forme)": "Meloetta",
+    "Meloetta (Pirouette Forme)": "Meloetta-Pirouette",
+    "Greninja (Ash-Greninja)": "Greninja-Ash",
+    "Aegislash (Shield Forme)": "Aegislash",
+    "Aegislash (Blade Forme)": "Aegislash-Blade",
+    "Rockruff (Own Tempo Rockruff)": "Rockruff-Own-Tempo",
+    "Wishiwashi (Solo Form)": "Wishiwashi",
+    "Wishiwashi (School Form)": "Wishiwashi-School",
+    "Minior (Meteor Form)": "Minior-Meteor",
+    "Minior (Core Form)": "Minior",
+    "Necrozma (Dusk Mane Necrozma)": "Necrozma-Dusk-Mane",
+    "Necrozma (Dawn Wings Necrozma)": "Necrozma-Dawn-Wings",
+    "Necrozma (Ultra Necrozma)": "Necrozma-Ultra",
+    "Eiscue (Ice Face)": "Eiscue",
+    "Eiscue (Noice Face)": "Eiscue-Noice",
+    "Morpeko (Full Belly Mode)": "Morpeko",
+    "Morpeko (Hangry Mode)": "Morpeko-Hangry",
+    "Zacian (Hero of Many Battles)": "Zacian",
+    "Zacian (Crowned Sword)": "Zacian-Crowned",
+    "Zamazenta (Hero of Many Battles)": "Zamazenta",
+    "Zamazenta (Crowned Shield)": "Zamazenta-Crowned",
+    "Eternatus (Eternamax)": "Eternatus-Eternamax",
+    "Calyrex (Ice Rider)": "Calyrex-Ice",
+    "Sandslash (Alolan Sandslash)": "Sandslash-Alola",
+    "Calyrex (Shadow Rider)": "Calyrex-Shadow",
+}
+
+
+def toid(name):
+    # Showdown id: "Mr. Mime-Galar" -> "mrmimegalar", "Nidoran♀" -> "nidoranf",
+    # "Flabébé" -> "flabebe", "Tera Blast" -> "terablast".
+    name = name.replace("♀", "f").replace("♂", "m")
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+
+def canonical_name(display_name):
+    return CUSTOM_NAME_CHANGES.get(display_name, display_name)
+
+
+def apply_canonical_name(entry):
+    # Renames an entry in place. When the abilities map has a tab under the old
+    # name ("Nidoran♂"), the tab is renamed too, so fix_abilities still finds
+    # the entry's own abilities.
+    display_name = entry["name"]
+    name = canonical_name(display_name)
+    abilities = entry.get("abilities")
+    if name != display_name and isinstance(abilities, dict) and display_name in abilities:
+        entry["abilities"] = {name if key == display_name else key: value for key, value in abilities.items()}
+    entry["name"] = name
+    return entry
+
+
+####################
+##  ALIAS INDEX   ##
+####################
+class AliasIndex:
+    # Resolves anything a user or a page might call an entry to its canonical
+    # name in one dict lookup on the Showdown id.
+    #
+    # Keys are the ids of the canonical names, of the pokemondb display names
+    # ("Rotom (Heat Rotom)") and of the form labels alone ("Heat Rotom"). A
+    # canonical name always wins over an alias, and an alias that would point
+    # at two different entries ("Male", "Female") is dropped.
+    def __init__(self, names=None):
+        names = list(names) if names is not None else list(dict.fromkeys(CUSTOM_NAME_CHANGES.values()))
+        self.names = {}
+        for name in names:
+            self.names.setdefault(toid(name), name)
+
+        known = set(names)
+        aliases = {}
+        ambiguous = set()
+        for display_name, name in CUSTOM_NAME_CHANGES.items():
+            if name not in known:
+                continue
+            keys = [toid(display_name)]
+            form = re.findall(r"\((.*?)\)", display_name)
+            if form:
+                keys.append(toid(form[0]))
+            for key in keys:
+                if key in self.names:
+                    continue
+                if aliases.get(key, name) != name:
+                    ambiguous.add(key)
+                aliases[key] = name
+        for key, name in aliases.items():
+            if key not in ambiguous:
+                self.names[key] = name
+
+    @classmethod
+    def from_entries(cls, entries):
+        return cls(entry["name"] for entry in entries)
+
+    def resolve(self, name):
+        # The canonical name, or None when nothing matches.
+        return self.names.get(toid(name))
+
+    def __getitem__(self, name):
+        canonical = self.resolve(name)
+        if canonical is None:
+            raise KeyError(name)
+        return canonical
+
+    def __contains__(self, name):
+        return toid(name) in self.names
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,188 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+from urllib.parse import urlsplit
+
+from .fetch import FetchError, add_fetch_arguments, async_fetcher_from_args
+from .httpcache import CacheMiss
+from .movecatalog import load_pokedex
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is only needed for the spritesheet atlases
+    Image = None
+
+
+MANIFEST = "manifest.json"
+ATLAS_MAP = "atlas.json"
+
+
+def absolute_url(url):
+    # items.json holds protocol-relative urls ("//archives.bulbagarden.net/...").
+    return "https:" + url if url.startswith("//") else url
+
+
+def asset_urls(entries, items=None):
+    # {"pokemon": [...], "items": [...]}: every distinct image url, in file order.
+    groups = {"pokemon": {}, "items": {}}
+    for entry in entries:
+        if entry.get("image"):
+            groups["pokemon"].setdefault(absolute_url(entry["image"]), None)
+    for item in (items or {}).values():
+        if item.get("Image"):
+            groups["items"].setdefault(absolute_url(item["Image"]), None)
+    return {group: list(urls) for group, urls in groups.items()}
+
+
+####################
+##    MIRROR      ##
+####################
+class AssetMirror:
+    # Downloads images into one directory, storing each distinct file once.
+    #
+    # Files are named by the sha256 of their content, so two urls serving the
+    # same sprite share one file. files maps every url to its file name and the
+    # manifest written next to the files records that mapping.
+    def __init__(self, directory):
+        self.directory = directory
+        self.files = {}
+        self.failed = []
+        os.makedirs(directory, exist_ok=True)
+
+    def add(self, url, content):
+        extension = os.path.splitext(urlsplit(url).path)[1].lower() or ".bin"
+        name = hashlib.sha256(content).hexdigest()[:32] + extension
+        path = os.path.join(self.directory, name)
+        if not os.path.exists(path):
+            tmp_path = path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        self.files[url] = name
+
+    async def fetch(self, fetcher, url):
+        # A failed asset is reported and recorded, never fatal to the rest of the mirror.
+        try:
+            response = await fetcher.get(url)
+        except (FetchError, CacheMiss) as e:
+            print(f"Error: {e}")
+            self.failed.append(url)
+            return
+        if response.status_code != 200:
+            print(f"Error: HTTP {response.status_code} for {url}")
+            self.failed.append(url)
+            return
+        self.add(url, response.content)
+
+    async def fetch_all(self, fetcher, urls):
+        # The AsyncFetcher bounds the requests in flight and paces each host.
+        await asyncio.gather(*(self.fetch(fetcher, url) for url in urls if url not in self.files))
+
+    def write_manifest(self):
+        with open(os.path.join(self.directory, MANIFEST), "w", encoding="utf-8") as f:
+            json.dump({"files": self.files, "failed": self.failed}, f, indent=1)
+
+
+####################
+##    ATLAS       ##
+####################
+def pack_shelves(sizes, width):
+    # Shelf packing: tallest first, left to right, a new shelf when a row is
+    # full. Returns the (x, y) of every size, in input order.
+    order = sorted(range(len(sizes)), key=lambda i: (-sizes[i][1], i))
+    positions = [None] * len(sizes)
+    x = y = shelf_height = 0
+    for i in order:
+        w, h = sizes[i]
+        if x and x + w > width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        positions[i] = (x, y)
+        x += w
+        shelf_height = max(shelf_height, h)
+    return positions
+
+
+def build_atlases(directory, groups, files, sheet_width=1024, sheet_height=2048):
+    # One or more PNG sheets per group of urls, and atlas.json mapping every url
+    # to [sheet, x, y, width, height]. A sheet is cut when it would grow past
+    # sheet_height.
+    if Image is None:
+        raise RuntimeError("spritesheet atlases need Pillow (pip install pillow)")
+    atlas = {"sheets": {}, "sprites": {}}
+    for group, urls in groups.items():
+        names = list(dict.fromkeys(files[url] for url in urls if url in files))
+        images = {}
+        for name in names:
+            with Image.open(os.path.join(directory, name)) as image:
+                images[name] = image.convert("RGBA")
+
+        sheets = []
+        remaining = names
+        while remaining:
+            sizes = [images[name].size for name in remaining]
+            positions = pack_shelves(sizes, sheet_width)
+            # Whatever lands below sheet_height waits for the next sheet; the
+            # sprite at (0, 0) always stays, however tall it is.
+            fits = [(name, x, y, w, h) for name, (x, y), (w, h) in zip(remaining, positions, sizes) if y + h <= sheet_height or (x, y) == (0, 0)]
+            sheet_name = f"{group}-{len(sheets)}.png"
+            sheet = Image.new("RGBA", (max(x + w for _, x, _, w, _ in fits), max(y + h for _, _, y, _, h in fits)))
+            placed = {}
+            for name, x, y, w, h in fits:
+                sheet.paste(images[name], (x, y))
+                placed[name] = [sheet_name, x, y, w, h]
+            sheet.save(os.path.join(directory, sheet_name), optimize=True)
+            sheets.append(sheet_name)
+            for url in urls:
+                if files.get(url) in placed:
+                    atlas["sprites"][url] = placed[files[url]]
+            remaining = [name for name in remaining if name not in placed]
+        atlas["sheets"][group] = sheets
+
+    with open(os.path.join(directory, ATLAS_MAP), "w", encoding="utf-8") as f:
+        json.dump(atlas, f, indent=1)
+    return atlas
+
+
+def add_arguments(parser):
+    add_fetch_arguments(parser)
+    parser.add_argument("pokedex", nargs="?", default="pokedex.json", help="pokedex file (json, ndjson or normalized)")
+    parser.add_argument("--items", help="items.json to mirror the item images too")
+    parser.add_argument("--output-dir", default="assets", help="directory for the images, manifest and atlases")
+    parser.add_argument("--atlas", action="store_true", help="also pack the images into spritesheets (needs Pillow)")
+    parser.add_argument("--sheet-width", type=int, default=1024, help="spritesheet width in pixels")
+
+
+def run(args):
+    if args.atlas and Image is None:
+        raise SystemExit("--atlas needs Pillow (pip install pillow)")
+    items = None
+    if args.items:
+        with open(args.items, encoding="utf-8") as f:
+            items = json.load(f)
+    groups = asset_urls(load_pokedex(args.pokedex), items)
+    urls = list(dict.fromkeys(url for group_urls in groups.values() for url in group_urls))
+
+    mirror = AssetMirror(args.output_dir)
+    fetcher = async_fetcher_from_args(args)
+    try:
+        asyncio.run(mirror.fetch_all(fetcher, urls))
+    finally:
+        fetcher.close()
+        mirror.write_manifest()
+    print(f"Mirrored {len(mirror.files)} urls into {len(set(mirror.files.values()))} files ({len(mirror.failed)} failed)")
+
+    if args.atlas:
+        atlas = build_atlases(args.output_dir, groups, mirror.files, args.sheet_width)
+        print(f"Packed {len(atlas['sprites'])} sprites into {sum(len(sheets) for sheets in atlas['sheets'].values())} sheets")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mirror the pokemon and item images locally and pack them into spritesheets")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
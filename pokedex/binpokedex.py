@@ -0,0 +1,272 @@
+import argparse
+import bisect
+import json
+import mmap
+import struct
+
+from .movecatalog import load_pokedex
+
+
+# File layout (little-endian, every section offset is from the start of the file):
+#
+#   header        magic, version, counts and section offsets (HEADER)
+#   strings       (count + 1) u32 offsets into the string data, then the UTF-8 data
+#   moves         one MOVE record per distinct (name, type, power, accuracy)
+#   entries       one fixed-width ENTRY record per Pokémon, in file order
+#   learnsets     LEARN records; each entry points at its run of them
+#   name index    u32 entry numbers sorted by casefolded name, for binary search
+#   blobs         compact JSON for the variable fields (abilities, evolutions, anything else)
+#
+# Nothing is decoded up front: the reader maps the file and unpacks single
+# records on demand, so opening is constant time and processes that map the
+# same file share its pages through the OS page cache.
+
+MAGIC = b"PKDX"
+VERSION = 1
+HEADER = struct.Struct("<4sHH11I")
+MOVE = struct.Struct("<IIhh")
+ENTRY = struct.Struct("<H7I2I7HBhIHII")
+LEARN = struct.Struct("<HBBH")
+U32 = struct.Struct("<I")
+
+NONE = 0xFFFFFFFF
+NO_LEVEL = 0xFF
+EVOLVES_ABSENT = -2
+EVOLVES_NONE = -1
+GENDER_BITS = {"Male": 1, "Female": 2, "Genderless": 4}
+STRING_FIELDS = ("name", "image", "species", "height", "weight", "local_no", "form_name")
+STAT_FIELDS = ("total", "hp", "attack", "defense", "sp_atk", "sp_def", "speed")
+FIXED_FIELDS = {"dex_number", "type", "moves", "gender", "Evolves"} | set(STRING_FIELDS) | set(STAT_FIELDS)
+# Key order of an extracted entry, used to rebuild entries in the same shape.
+KEY_ORDER = ("image", "dex_number", "name", "type", "total", "hp", "attack", "defense", "sp_atk", "sp_def", "speed",
+             "form_name", "species", "height", "weight", "abilities", "local_no", "moves", "gender", "evolutions", "Evolves")
+
+
+####################
+##    WRITING     ##
+####################
+def write_binary(entries, path):
+    strings = {}
+    string_list = []
+
+    def intern(value):
+        if value is None:
+            return NONE
+        if value not in strings:
+            strings[value] = len(string_list)
+            string_list.append(value)
+        return strings[value]
+
+    moves = {}
+    move_records = []
+    entry_records = []
+    learn_records = []
+    blobs = bytearray()
+
+    for entry in entries:
+        if not isinstance(entry.get("moves", {}), dict):
+            raise ValueError(f"{entry['name']}: binary export needs dict-shaped moves (extendedextractor.py output)")
+
+        learn_start = len(learn_records)
+        for move_data in entry.get("moves", {}).values():
+            key = (move_data["move"], move_data["type"], move_data["power"], move_data["accuracy"])
+            if key not in moves:
+                moves[key] = len(move_records)
+                move_records.append(MOVE.pack(
+                    intern(key[0]), intern(key[1]),
+                    -1 if key[2] is None else key[2], -1 if key[3] is None else key[3]))
+            generations = 0
+            for gen in move_data["generations"]:
+                generations |= 1 << gen
+            level = move_data["level"]
+            learn_records.append(LEARN.pack(moves[key], NO_LEVEL if level is None else level, 0, generations))
+
+        extras = {key: value for key, value in entry.items() if key not in FIXED_FIELDS}
+        blob = json.dumps(extras, ensure_ascii=False, separators=(',', ':')).encode("utf-8")
+        blob_offset = len(blobs)
+        blobs += blob
+
+        types = list(entry.get("type", [])) + [None, None]
+        gender = 0
+        for value in entry.get("gender", []):
+            gender |= GENDER_BITS[value]
+        evolves = entry.get("Evolves", EVOLVES_ABSENT)
+        if evolves is None:
+            evolves = EVOLVES_NONE
+
+        entry_records.append(ENTRY.pack(
+            entry["dex_number"],
+            *(intern(entry.get(field)) for field in STRING_FIELDS),
+            intern(types[0]), intern(types[1]),
+            *(entry[field] for field in STAT_FIELDS),
+            gender,
+            evolves,
+            learn_start,
+            len(learn_records) - learn_start,
+            blob_offset,
+            len(blob),
+        ))
+
+    names = sorted(range(len(entries)), key=lambda i: entries[i]["name"].casefold())
+
+    encoded = [s.encode("utf-8") for s in string_list]
+    string_offsets = [0]
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    strings_offset = HEADER.size
+    string_data_offset = strings_offset + U32.size * len(string_offsets)
+    moves_offset = string_data_offset + string_offsets[-1]
+    entries_offset = moves_offset + MOVE.size * len(move_records)
+    learnsets_offset = entries_offset + ENTRY.size * len(entry_records)
+    names_offset = learnsets_offset + LEARN.size * len(learn_records)
+    blobs_offset = names_offset + U32.size * len(names)
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(
+            MAGIC, VERSION, 0,
+            len(entry_records), len(string_list), len(move_records), len(learn_records),
+            strings_offset, string_data_offset, moves_offset, entries_offset, learnsets_offset, names_offset, blobs_offset,
+        ))
+        f.write(b"".join(U32.pack(offset) for offset in string_offsets))
+        f.write(b"".join(encoded))
+        f.write(b"".join(move_records))
+        f.write(b"".join(entry_records))
+        f.write(b"".join(learn_records))
+        f.write(b"".join(U32.pack(i) for i in names))
+        f.write(blobs)
+
+
+####################
+##    READING     ##
+####################
+class BinaryPokedex:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, _, self.count, self.string_count, self.move_count, self.learn_count,
+         self.strings_offset, self.string_data_offset, self.moves_offset, self.entries_offset,
+         self.learnsets_offset, self.names_offset, self.blobs_offset) = HEADER.unpack_from(self.data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} binary pokedex")
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        for i in range(self.count):
+            yield self.entry(i)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        self.data.close()
+        self.file.close()
+
+    def string(self, i):
+        if i == NONE:
+            return None
+        start, end = struct.unpack_from("<II", self.data, self.strings_offset + U32.size * i)
+        return self.data[self.string_data_offset + start:self.string_data_offset + end].decode("utf-8")
+
+    def _record(self, i):
+        return ENTRY.unpack_from(self.data, self.entries_offset + ENTRY.size * i)
+
+    def name(self, i):
+        return self.string(self._record(i)[1])
+
+    def dex_number(self, i):
+        return self._record(i)[0]
+
+    def learnset(self, i, record=None):
+        record = record or self._record(i)
+        start, count = record[19], record[20]
+        moves = {}
+        for n in range(start, start + count):
+            move_index, level, _, generations = LEARN.unpack_from(self.data, self.learnsets_offset + LEARN.size * n)
+            name, move_type, power, accuracy = MOVE.unpack_from(self.data, self.moves_offset + MOVE.size * move_index)
+            move = self.string(name)
+            moves[move] = {
+                "level": None if level == NO_LEVEL else level,
+                "move": move,
+                "type": self.string(move_type),
+                "power": None if power < 0 else power,
+                "accuracy": None if accuracy < 0 else accuracy,
+                "generations": [gen for gen in range(16) if generations >> gen & 1],
+            }
+        return moves
+
+    def entry(self, i):
+        record = self._record(i)
+        fields = {"dex_number": record[0]}
+        for field, index in zip(STRING_FIELDS, record[1:8]):
+            if index != NONE:
+                fields[field] = self.string(index)
+        fields["type"] = [self.string(index) for index in record[8:10] if index != NONE]
+        fields.update(zip(STAT_FIELDS, record[10:17]))
+        gender, evolves = record[17], record[18]
+        fields["gender"] = [value for value, bit in GENDER_BITS.items() if gender & bit]
+        if evolves != EVOLVES_ABSENT:
+            fields["Evolves"] = None if evolves == EVOLVES_NONE else evolves
+        fields["moves"] = self.learnset(i, record)
+        blob_offset, blob_length = record[21], record[22]
+        start = self.blobs_offset + blob_offset
+        fields.update(json.loads(self.data[start:start + blob_length]))
+
+        entry = {key: fields.pop(key) for key in KEY_ORDER if key in fields}
+        entry.update(fields)
+        return entry
+
+    def _name_at(self, position):
+        i = U32.unpack_from(self.data, self.names_offset + U32.size * position)[0]
+        return self.name(i).casefold(), i
+
+    def get(self, name):
+        # Binary search over the name index; decodes O(log n) names.
+        key = name.casefold()
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._name_at(mid)[0] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.count:
+            found, i = self._name_at(lo)
+            if found == key:
+                return self.entry(i)
+        return None
+
+    def by_dex_number(self, dex_number):
+        # Entries are stored in /pokedex/all order, which is sorted by dex number.
+        lo = bisect.bisect_left(range(self.count), dex_number, key=self.dex_number)
+        entries = []
+        while lo < self.count and self.dex_number(lo) == dex_number:
+            entries.append(self.entry(lo))
+            lo += 1
+        return entries
+
+
+def add_arguments(parser):
+    parser.add_argument("input", help="pokedex JSON, NDJSON or normalized file")
+    parser.add_argument("output", help="binary file to write, e.g. pokedex.bin")
+
+
+def run(args):
+    entries = load_pokedex(args.input)
+    write_binary(entries, args.output)
+    print(f"Wrote {len(entries)} entries to {args.output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export a pokedex file to the memory-mappable binary format")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
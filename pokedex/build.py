@@ -0,0 +1,72 @@
+import argparse
+import asyncio
+import os
+
+from .extendedextractor import add_arguments as add_extract_arguments, fetch_pokedex, open_journal, parse_pool_from_args, write_pokedex
+from .fetch import async_fetcher_from_args
+from .item import fetch_items, item_pages, write_items
+from .metrics import METRICS
+from .selection import parse_range
+
+
+####################
+##     BUILD      ##
+####################
+# extract + hotfix + minify + items in one run. The pokedex and item jobs do
+# not depend on each other, so they run together on one AsyncFetcher (one
+# connection pool, one HTTP cache and one per-host rate limit) and one
+# ParsePool (--workers processes in all).
+
+async def fetch_all(args, journal, done_keys):
+    fetcher = async_fetcher_from_args(args)
+    parse_pool = parse_pool_from_args(args)
+    try:
+        return await asyncio.gather(
+            fetch_pokedex(args, journal, done_keys, fetcher, parse_pool),
+            fetch_items(fetcher, item_pages(args.item_gens), parse_pool=parse_pool),
+        )
+    finally:
+        await parse_pool.close()
+        fetcher.close()
+
+
+def add_arguments(parser):
+    add_extract_arguments(parser)
+    parser.add_argument("--items-output", default="items.json", help="item file to write")
+    # --gens only selects move pages: the item lists cover Generations 3-9.
+    parser.add_argument("--item-gens", type=parse_range, default=(None, None), metavar="RANGE", help="only these generations' item pages (3-9), e.g. 8-9")
+    parser.add_argument("--no-fix-abilities", dest="fix_abilities", action="store_false", help="keep the {form: abilities} map instead of reshaping it like hotfix.py")
+    parser.set_defaults(output="pokedex.json", fix_abilities=True)
+
+
+def minified_path(output):
+    # pokedex.json -> minified_pokedex.json, in the same directory.
+    directory, name = os.path.split(output)
+    return os.path.join(directory, "minified_" + name)
+
+
+def run(args):
+    # Without any --also, a minified copy is written next to the output.
+    if not args.also:
+        args.also = [f"minified:{minified_path(args.output)}"]
+
+    journal, done_keys = open_journal(args)
+    try:
+        with METRICS.timer("stage_seconds", stage="fetch"):
+            pokemon_list, all_items = asyncio.run(fetch_all(args, journal, done_keys))
+    finally:
+        journal.close()
+    with METRICS.timer("stage_seconds", stage="assemble"):
+        write_pokedex(args, journal, pokemon_list)
+    with METRICS.timer("stage_seconds", stage="write_items"):
+        write_items(args.items_output, all_items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build pokedex.json, minified_pokedex.json and items.json in one run")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import argparse
+
+from . import assets, binpokedex, build, delta, extendedextractor, extractor, fuzzy, hotfix, item, itemdex, legality, minify, movecatalog
+from .metrics import METRICS, add_metrics_arguments
+
+
+# Subcommand -> module. Each module supplies add_arguments(parser) and run(args),
+# and still works on its own through python -m pokedex.<module>.
+COMMANDS = {
+    "build": (build, "fetch the pokedex and the items together and write every output file"),
+    "extract": (extendedextractor, "extract the full pokedex (moves per generation, form abilities)"),
+    "extract-basic": (extractor, "extract the pokedex with the simple, sequential extractor"),
+    "items": (item, "extract the Gen 3 - Gen 9 items from Bulbapedia"),
+    "item-index": (itemdex, "write the compact item index used for item legality checks"),
+    "assets": (assets, "mirror the pokemon and item images locally and pack them into spritesheets"),
+    "delta": (delta, "compute the delta between two pokedex builds, or apply one"),
+    "hotfix": (hotfix, "reduce each entry's abilities to those of its own form"),
+    "minify": (minify, "write a copy of a pokedex file without whitespace"),
+    "normalize": (movecatalog, "convert a pokedex file to or from the normalized move-catalog format"),
+    "binary": (binpokedex, "export a pokedex file to the memory-mappable binary format"),
+    "validate": (legality, "validate Showdown teams against a pokedex file"),
+    "fuzzy": (fuzzy, "build the fuzzy name index for pokemon, forms, moves and items"),
+}
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(prog="pokedex", description="Scrape, convert and query Pokédex data")
+    add_metrics_arguments(parser)
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND", required=True)
+    for name, (module, description) in COMMANDS.items():
+        subparser = subparsers.add_parser(name, help=description, description=description)
+        module.add_arguments(subparser)
+        subparser.set_defaults(run=module.run)
+    return parser
+
+
+def main(argv=None):
+    args = make_parser().parse_args(argv)
+    METRICS.reset()
+    try:
+        args.run(args)
+    finally:
+        METRICS.write(args.metrics, args.metrics_prometheus)
+
+
+if __name__ == "__main__":
+    main()
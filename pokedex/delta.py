@@ -0,0 +1,171 @@
+import argparse
+import hashlib
+import json
+
+from .movecatalog import load_pokedex
+
+
+FORMAT_NAME = "pokedex-delta-v1"
+
+
+def entry_version(entry):
+    # Content hash of one entry; equal entries get equal versions whatever their key order.
+    text = json.dumps(entry, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def dex_version(keys, versions):
+    # Version stamp of a whole file: the hash of its keys and entry versions in order.
+    digest = hashlib.sha256()
+    for key in keys:
+        digest.update(f"{key}\t{versions[key]}\n".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class EntryKeys:
+    # Names are not unique (a species row and a form row can share one), so the
+    # n-th entry with a name is keyed "name#n" from the second on.
+    def __init__(self):
+        self.counts = {}
+
+    def key(self, entry):
+        name = entry["name"]
+        count = self.counts[name] = self.counts.get(name, 0) + 1
+        return name if count == 1 else f"{name}#{count}"
+
+
+####################
+##   DELTA BASE   ##
+####################
+class DeltaBase:
+    # Keys, order and entry versions of a previous build: all a delta is computed against.
+    def __init__(self, keys, versions):
+        self.keys = keys
+        self.versions = versions
+        self.version = dex_version(keys, versions)
+
+    @classmethod
+    def from_entries(cls, entries):
+        entry_keys = EntryKeys()
+        keys = []
+        versions = {}
+        for entry in entries:
+            key = entry_keys.key(entry)
+            keys.append(key)
+            versions[key] = entry_version(entry)
+        return cls(keys, versions)
+
+    @classmethod
+    def load(cls, path):
+        # Any format written by the extractors; a missing file is an empty base,
+        # so the first build's delta upserts everything.
+        try:
+            return cls.from_entries(load_pokedex(path))
+        except FileNotFoundError:
+            return cls([], {})
+
+
+####################
+##  DELTA WRITER  ##
+####################
+class DeltaWriter:
+    # Streams {"format", "from", "upserts", "deletes", "order", "to"} as entries
+    # are written. Only entries that are new or whose version changed are kept,
+    # each as {"key", "version", "entry"}; deletes and the final version stamp
+    # are only known at close(). "order" lists every key when applying the
+    # upserts and deletes in place would not reproduce the new order, and is
+    # null otherwise.
+    def __init__(self, f, base):
+        self.f = f
+        self.base = base
+        self.entry_keys = EntryKeys()
+        self.keys = []
+        self.versions = {}
+        self.count = 0
+        self.f.write('{"format":"%s","from":"%s","upserts":[' % (FORMAT_NAME, base.version))
+
+    def write(self, entry):
+        key = self.entry_keys.key(entry)
+        version = entry_version(entry)
+        self.keys.append(key)
+        self.versions[key] = version
+        if self.base.versions.get(key) != version:
+            text = json.dumps({"key": key, "version": version, "entry": entry}, ensure_ascii=False, separators=(',', ':'))
+            self.f.write(("," if self.count else "") + text)
+            self.count += 1
+
+    def close(self):
+        self.deletes = [key for key in self.base.keys if key not in self.versions]
+        deleted = set(self.deletes)
+        in_place = [key for key in self.base.keys if key not in deleted]
+        known = set(in_place)
+        in_place += [key for key in self.keys if key not in known]
+        order = None if in_place == self.keys else self.keys
+        self.f.write('],"deletes":%s,"order":%s,"to":"%s"}' % (
+            json.dumps(self.deletes, ensure_ascii=False),
+            json.dumps(order, ensure_ascii=False),
+            dex_version(self.keys, self.versions),
+        ))
+
+
+def apply_delta(entries, delta, verify=True):
+    # The entries of the new build from the previous build's entries and a delta.
+    # With verify, refuses a delta made against a different base and checks the result's stamp.
+    if delta.get("format") != FORMAT_NAME:
+        raise ValueError(f"not a {FORMAT_NAME} delta")
+    base = DeltaBase.from_entries(entries)
+    if verify and base.version != delta["from"]:
+        raise ValueError(f"delta is against version {delta['from']}, these entries are version {base.version}")
+
+    by_key = dict(zip(base.keys, entries))
+    deleted = set(delta["deletes"])
+    keys = [key for key in base.keys if key not in deleted]
+    for upsert in delta["upserts"]:
+        if upsert["key"] not in by_key:
+            keys.append(upsert["key"])
+        by_key[upsert["key"]] = upsert["entry"]
+    if delta["order"] is not None:
+        keys = delta["order"]
+
+    result = [by_key[key] for key in keys]
+    if verify:
+        new = DeltaBase.from_entries(result)
+        if new.version != delta["to"]:
+            raise ValueError(f"applying the delta gave version {new.version}, expected {delta['to']}")
+    return result
+
+
+def add_arguments(parser):
+    parser.add_argument("base", help="previous pokedex file (json, ndjson or normalized)")
+    parser.add_argument("target", help="new pokedex file, or with --apply the delta to apply")
+    parser.add_argument("--apply", action="store_true", help="apply the delta in TARGET to BASE instead of computing one")
+    parser.add_argument("--output", required=True, help="delta file to write, or with --apply the updated pokedex file")
+
+
+def run(args):
+    if args.apply:
+        with open(args.target, encoding="utf-8") as f:
+            delta = json.load(f)
+        entries = apply_delta(load_pokedex(args.base), delta)
+        with open(args.output, "w") as f:
+            json.dump(entries, f, indent=4)
+        print(f"Applied {len(delta['upserts'])} upserts and {len(delta['deletes'])} deletes: version {delta['to']}")
+        return
+
+    base = DeltaBase.load(args.base)
+    with open(args.output, "w", encoding="utf-8") as f:
+        writer = DeltaWriter(f, base)
+        for entry in load_pokedex(args.target):
+            writer.write(entry)
+        writer.close()
+    print(f"{writer.count} upserts and {len(writer.deletes)} deletes from version {base.version} to {len(writer.keys)} entries")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute the delta between two pokedex builds, or apply one")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
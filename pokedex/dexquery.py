@@ -0,0 +1,155 @@
+import bisect
+from collections import defaultdict
+from functools import cached_property
+
+from .aliases import AliasIndex
+from .evolution import EvolutionGraph
+from .movecatalog import load_pokedex
+from .pipeline import fix_abilities
+
+
+STATS = ("total", "hp", "attack", "defense", "sp_atk", "sp_def", "speed")
+
+
+def entry_abilities(entry):
+    # Abilities are a {form: [abilities]} map straight out of the extractor and a
+    # flat list once hotfix.py has run. From the map only the entry's own form
+    # counts, picked the way fix_abilities does, so a form is not allowed the
+    # abilities of its siblings.
+    abilities = fix_abilities(entry).get("abilities") or []
+    return abilities if isinstance(abilities, list) else []
+
+
+####################
+##    POKEDEX     ##
+####################
+class Pokedex:
+    # Read-only queries over the extracted entries.
+    #
+    # Every index maps a key to entry positions and is built on first use, so
+    # loading the file and doing a single name lookup never pays for the others.
+    # Name, type, ability and gender keys are case-insensitive. Results come back
+    # in pokedex order unless noted otherwise.
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self._stat_indexes = {}
+
+    @classmethod
+    def load(cls, path):
+        # Any format written by the extractors: json, ndjson or normalized.
+        return cls(load_pokedex(path))
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def _group(self, keys):
+        index = defaultdict(list)
+        for i, entry in enumerate(self.entries):
+            for key in dict.fromkeys(keys(entry)):
+                index[key].append(i)
+        return dict(index)
+
+    def _select(self, positions):
+        return [self.entries[i] for i in positions]
+
+    @cached_property
+    def _by_name(self):
+        return {entry["name"].casefold(): i for i, entry in enumerate(self.entries)}
+
+    @cached_property
+    def _by_dex_number(self):
+        return self._group(lambda entry: [entry["dex_number"]])
+
+    @cached_property
+    def _by_type(self):
+        return self._group(lambda entry: [t.casefold() for t in entry.get("type", [])])
+
+    @cached_property
+    def _by_ability(self):
+        return self._group(lambda entry: [a.casefold() for a in entry_abilities(entry)])
+
+    @cached_property
+    def _by_gender(self):
+        return self._group(lambda entry: [g.casefold() for g in entry.get("gender", [])])
+
+    @cached_property
+    def evolution_graph(self):
+        # prevo(), evolutions(), lineage() and family() by species name.
+        return EvolutionGraph.from_entries(self.entries)
+
+    def _stat_index(self, stat):
+        # (sorted values, positions in the same order) for bisecting on one stat.
+        if stat not in STATS:
+            raise ValueError(f"Unknown stat: {stat}")
+        if stat not in self._stat_indexes:
+            order = sorted(range(len(self.entries)), key=lambda i: self.entries[i][stat])
+            self._stat_indexes[stat] = ([self.entries[i][stat] for i in order], order)
+        return self._stat_indexes[stat]
+
+    ####################
+    ##    LOOKUPS     ##
+    ####################
+    @cached_property
+    def aliases(self):
+        # Display names, form labels and Showdown ids -> entry names.
+        return AliasIndex.from_entries(self.entries)
+
+    def get(self, name):
+        # Exact names first, then any alias: "Rotom (Heat Rotom)", "heat rotom", "rotomheat".
+        i = self._by_name.get(name.casefold())
+        if i is None:
+            alias = self.aliases.resolve(name)
+            i = self._by_name.get(alias.casefold()) if alias else None
+        return self.entries[i] if i is not None else None
+
+    def __getitem__(self, name):
+        entry = self.get(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def by_dex_number(self, dex_number):
+        # The base entry and every form sharing the national number.
+        return self._select(self._by_dex_number.get(dex_number, []))
+
+    def with_type(self, type_name):
+        return self._select(self._by_type.get(type_name.casefold(), []))
+
+    def with_ability(self, ability):
+        return self._select(self._by_ability.get(ability.casefold(), []))
+
+    def with_gender(self, gender):
+        return self._select(self._by_gender.get(gender.casefold(), []))
+
+    def stat_range(self, stat, low=None, high=None):
+        # Entries with low <= stat <= high (either bound may be None), sorted by the stat.
+        return self._select(self._stat_positions(stat, low, high))
+
+    def _stat_positions(self, stat, low, high):
+        values, order = self._stat_index(stat)
+        start = bisect.bisect_left(values, low) if low is not None else 0
+        end = bisect.bisect_right(values, high) if high is not None else len(values)
+        return order[start:end]
+
+    def find(self, type=None, ability=None, gender=None, **stat_ranges):
+        # Combines the indexes: find(type="Fire", speed=(101, None)) is every Fire
+        # type with speed above 100. Stat ranges are inclusive (low, high) pairs.
+        candidates = None
+        # Index names, not the indexes: each one is only built if its key is given.
+        for index_name, key in (("_by_type", type), ("_by_ability", ability), ("_by_gender", gender)):
+            if key is None:
+                continue
+            positions = set(getattr(self, index_name).get(key.casefold(), []))
+            candidates = positions if candidates is None else candidates & positions
+        for stat, (low, high) in stat_ranges.items():
+            positions = set(self._stat_positions(stat, low, high))
+            candidates = positions if candidates is None else candidates & positions
+        if candidates is None:
+            return list(self.entries)
+        return self._select(sorted(candidates))
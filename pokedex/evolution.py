@@ -0,0 +1,98 @@
+from collections import deque
+
+
+####################
+##   EVOLUTION    ##
+####################
+class EvolutionGraph:
+    # Evolution edges from the species pages' evolution charts, keyed by
+    # casefolded name.
+    #
+    # Every species page prints its whole family, so the same edge usually
+    # shows up on several pages; the first copy wins. Nodes are the names in
+    # the chart, which are the base names of the dex entries ("Raichu", not
+    # "Raichu-Alola").
+    def __init__(self, edges=()):
+        self._names = {}
+        self._prevo = {}
+        self._evolutions = {}
+        for source, target, level in edges:
+            self.add(source, target, level)
+
+    @classmethod
+    def from_entries(cls, entries):
+        # Rebuilds the graph from an extracted file's evolves_from/Evolves fields.
+        return cls((entry["evolves_from"], entry["name"], entry.get("Evolves"))
+                   for entry in entries if entry.get("evolves_from"))
+
+    def add(self, source, target, level):
+        source_key, target_key = source.casefold(), target.casefold()
+        if target_key in self._prevo:
+            return
+        self._names.setdefault(source_key, source)
+        self._names.setdefault(target_key, target)
+        self._prevo[target_key] = (source_key, level)
+        self._evolutions.setdefault(source_key, []).append(target_key)
+
+    def __contains__(self, name):
+        return name.casefold() in self._names
+
+    def __len__(self):
+        return len(self._names)
+
+    def prevo(self, name):
+        # The species this one evolves from, or None.
+        edge = self._prevo.get(name.casefold())
+        return self._names[edge[0]] if edge else None
+
+    def level(self, name):
+        # The level on the arrow into this species (None for stones, trades, ...).
+        edge = self._prevo.get(name.casefold())
+        return edge[1] if edge else None
+
+    def evolutions(self, name):
+        return [self._names[key] for key in self._evolutions.get(name.casefold(), [])]
+
+    def lineage(self, name):
+        # [name, prevo, prevo's prevo, ...]
+        key = name.casefold()
+        keys = [key]
+        while key in self._prevo and self._prevo[key][0] not in keys:
+            key = self._prevo[key][0]
+            keys.append(key)
+        return [self._names.get(key, name) for key in keys]
+
+    def family(self, name):
+        # Every member of the family, breadth first from the unevolved root.
+        root = self.lineage(name)[-1].casefold()
+        seen = {root}
+        queue = deque([root])
+        members = []
+        while queue:
+            key = queue.popleft()
+            members.append(self._names.get(key, name))
+            for child in self._evolutions.get(key, []):
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+        return members
+
+    def inherit(self, values, merge):
+        # {name: value} -> {name: value merged with every prevo's value}, e.g.
+        # learnset bitsets merged with |. Names without a prevo keep their value.
+        keys = {name.casefold(): name for name in values}
+        inherited = {}
+
+        def resolve(key, seen):
+            if key in inherited:
+                return inherited[key]
+            value = values.get(keys[key]) if key in keys else None
+            prevo = self._prevo.get(key)
+            if prevo and prevo[0] not in seen:
+                prevo_value = resolve(prevo[0], seen | {key})
+                if prevo_value is not None:
+                    value = prevo_value if value is None else merge(value, prevo_value)
+            inherited[key] = value
+            return value
+
+        return {name: resolve(key, frozenset()) for key, name in keys.items()}
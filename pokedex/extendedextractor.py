@@ -0,0 +1,353 @@
+import argparse
+import asyncio
+import os
+import re
+from tqdm.asyncio import tqdm
+import colorama
+from .aliases import apply_canonical_name, canonical_name
+from .fetch import add_fetch_arguments, async_fetcher_from_args
+from .journal import Journal, index_journal
+from .metrics import METRICS
+from .parsepool import ParsePool
+from .parsing import add_parser_arguments, get_evolution_edges, get_evolutions, get_form_abilities, get_gender, get_move_rows, get_pokemon_list, get_vitals, make_soup
+from .pipeline import add_output_arguments, pipeline_from_args
+from .planner import FetchPlan
+from .selection import add_dex_argument, in_range, parse_range
+colorama.init()
+
+
+####################
+##  Sanitize Name ##
+####################
+def sanitize_name(name, is_alt_form=False):
+    name = name.replace("♀", "-f").replace("♂", "-m")
+    name = name.replace("é", "e")  # Replace "é" with "e"
+    name = re.sub(r"[^a-zA-Z0-9\s-]", "", name)  # Remove any special characters except spaces and hyphens
+    name = name.replace(" ", "-")  # Replace spaces with hyphens
+    name = name.lower()
+    return name
+
+####################
+##  Get Base Name ##
+####################
+def get_base_name(name):
+    base_name = re.sub(r'\s\(.*\)', '', name)  # Remove form name from alternate forms
+    return base_name
+    
+##########################
+## GET MOVES FROM TABLE ##
+##########################
+def get_moves_from_table(moves_table, gen):
+    moves = {}
+    for level, move, move_type, power, accuracy in get_move_rows(moves_table):
+        move_data = {
+            "level": int(level) if level and level.isdigit() else None,
+            "move": move,
+            "type": move_type,
+            "power": power,
+            "accuracy": accuracy,
+            "generations": [gen]
+        }
+
+        # Check if the move already exists in the moves dictionary.
+        if move in moves:
+            # If it does, just append the current generation to the "generations" list.
+            moves[move]["generations"].append(gen)
+        else:
+            # If not, add the new move to the dictionary.
+            moves[move] = move_data
+
+    return moves
+
+####################
+##   GET MOVES    ##
+####################
+def merge_moves(all_moves, gen_moves, gen):
+    # Iterate over the gen_moves dictionary
+    for move, move_data in gen_moves.items():
+        # Check if the move already exists in the all_moves dictionary.
+        if move in all_moves:
+            # If it does, append the current generation to the "generations" list.
+            if gen not in all_moves[move]["generations"]:
+                all_moves[move]["generations"].append(gen)
+        else:
+            # If not, add the new move to the dictionary.
+            all_moves[move] = move_data
+
+
+def parse_moves_page(html, gen, backend=None, partial=True):
+    soup = make_soup(html, "moves", backend, partial)
+    page_moves = {}
+    for moves_table in soup.find_all("table", class_="data-table"):
+        merge_moves(page_moves, get_moves_from_table(moves_table, gen), gen)
+    return page_moves
+
+
+async def get_moves_page(fetcher, parse_pool, name, gen):
+    response = await fetcher.get(f"https://pokemondb.net/pokedex/{name}/moves/{gen}")
+    # No page for a generation the species is not in; anything else that is
+    # still an error after the retries stops the run (resume with --resume).
+    if response.status_code == 404:
+        return None
+    response.raise_for_status()
+    return await parse_pool.submit(parse_moves_page, response.text, gen, *parse_pool.parser_options)
+
+
+GENERATIONS = range(1, 10)
+
+
+async def get_moves(fetcher, parse_pool, name, generations=GENERATIONS):
+    # Request every generation together; each page is parsed as soon as it
+    # arrives and the results are merged in generation order.
+    gen_moves = await asyncio.gather(*(get_moves_page(fetcher, parse_pool, name, i) for i in generations))
+    all_moves = {}
+    for i, moves in zip(generations, gen_moves):
+        if moves is not None:
+            merge_moves(all_moves, moves, i)
+    return all_moves
+
+
+
+
+####################
+##  GET DETAILS   ##
+####################      
+def parse_pokemon_page(html, url, backend=None, partial=True):
+    soup = make_soup(html, "species", backend, partial)
+
+    abilities_map = get_form_abilities(soup)
+
+    vitals = get_vitals(soup)
+    if not vitals:
+        print(f"Error: Table not found for URL: {url}")
+        return None
+
+    details = {
+        "species": vitals["species"],
+        "height": vitals["height"],
+        "weight": vitals["weight"],
+        "abilities": abilities_map,
+        "local_no": vitals["local_no"],
+        "moves": None,  # Filled in from the move pages by get_pokemon_details
+        "gender": get_gender(soup),
+        "evolutions": get_evolutions(soup),
+        "evolution_edges": get_evolution_edges(soup)  # Journal only; feeds the evolution graph
+    }
+
+    return details
+
+async def get_pokemon_details(fetcher, parse_pool, name, url, plan, dex_number=None):
+    response = await fetcher.get(url)
+    if response.status_code == 404:
+        print(f"Error: Page not found for URL: {url}")
+        return None
+    response.raise_for_status()
+    details = await parse_pool.submit(parse_pokemon_page, response.text, url, *parse_pool.parser_options)
+    if details:
+        # The species page says which move pages can exist.
+        generations = plan.generations_for(dex_number, details["local_no"])
+        details["moves"] = await get_moves(fetcher, parse_pool, name, generations)
+    return details
+
+
+async def get_species(species_slots, fetcher, parse_pool, name, url, plan, dex_number=None):
+    # Bounding the species in flight bounds the raw pages waiting to be parsed.
+    async with species_slots:
+        return await get_pokemon_details(fetcher, parse_pool, name, url, plan, dex_number)
+
+####################
+##  FETCH ALL     ##
+####################
+def parse_pool_from_args(args):
+    return ParsePool(args.workers, parser_options=(args.parser, not args.full_parse))
+
+
+async def journal_row(journal, key, pokemon, species_tasks, pending_rows, sanitized_name):
+    details = await species_tasks[sanitized_name]
+    if details:
+        journal.append(key, {"dex_number": pokemon["dex_number"], "name": pokemon["name"], "details": details})
+
+    # Once every row of a species is journaled, drop its parsed pages.
+    pending_rows[sanitized_name] -= 1
+    if not pending_rows[sanitized_name]:
+        del species_tasks[sanitized_name]
+
+
+async def fetch_pokedex(args, journal, done_keys, fetcher=None, parse_pool=None):
+    # Pass a fetcher or parse pool to share it with other jobs; otherwise one is
+    # made (and closed) here.
+    own_fetcher = fetcher is None
+    if own_fetcher:
+        fetcher = async_fetcher_from_args(args)
+    own_pool = parse_pool is None
+    if own_pool:
+        parse_pool = parse_pool_from_args(args)
+    species_slots = asyncio.Semaphore(args.concurrency)
+    plan = FetchPlan((gen for gen in GENERATIONS if in_range(gen, args.gens)), enabled=not args.all_move_pages)
+    try:
+        response = await fetcher.get("https://pokemondb.net/pokedex/all")
+        response.raise_for_status()
+        pokemon_list = await parse_pool.submit(get_pokemon_list, response.text, *parse_pool.parser_options)
+        pokemon_list = [pokemon for pokemon in pokemon_list if in_range(pokemon["dex_number"], args.dex)]
+
+        # Alternate forms resolve to their base species' page, so each species page
+        # (and its move pages) is fetched and parsed once and shared by every form.
+        species_tasks = {}
+        pending_rows = {}
+        tasks = []
+        for pokemon in pokemon_list:
+            key = Journal.key(pokemon["dex_number"], pokemon["name"])
+            if key in done_keys:
+                continue
+            base_name = get_base_name(pokemon["name"])
+            sanitized_name = sanitize_name(base_name)
+            if sanitized_name not in species_tasks:
+                pokedex_url = f"https://pokemondb.net/pokedex/{sanitized_name}"
+                species_tasks[sanitized_name] = asyncio.ensure_future(
+                    get_species(species_slots, fetcher, parse_pool, sanitized_name, pokedex_url, plan, pokemon["dex_number"])
+                )
+            pending_rows[sanitized_name] = pending_rows.get(sanitized_name, 0) + 1
+            tasks.append(journal_row(journal, key, pokemon, species_tasks, pending_rows, sanitized_name))
+
+        # Every row is written to the journal as soon as its pages are parsed.
+        await tqdm.gather(
+            *tasks,
+            total=len(tasks),
+            desc="Extracting Data",
+            unit="pokemon",
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [Elapsed: {elapsed}, Remaining: {remaining}]",
+            colour='green'
+        )
+        print(plan.report())
+    finally:
+        if own_pool:
+            await parse_pool.close()
+        if own_fetcher:
+            fetcher.close()
+
+    return pokemon_list
+
+
+def add_arguments(parser):
+    add_fetch_arguments(parser)
+    add_parser_arguments(parser)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="parser processes (0 parses in the main process)")
+    parser.add_argument("--journal", default="pokemon_data.journal.jsonl", help="checkpoint file that records every finished entry")
+    parser.add_argument("--resume", action="store_true", help="skip entries already in the journal and build the output from it")
+    add_dex_argument(parser)
+    parser.add_argument("--gens", type=parse_range, default=(None, None), metavar="RANGE", help="only fetch the move pages of these generations, e.g. 8-9")
+    parser.add_argument("--all-move-pages", action="store_true", help="request every generation's move page, even those from before the species existed")
+    add_output_arguments(parser)
+
+
+def open_journal(args):
+    # The journal opened for appending, and the keys it already holds when resuming.
+    journal = Journal(args.journal)
+    done_keys = journal.keys() if args.resume else set()
+    journal.open(resume=args.resume)
+    return journal, done_keys
+
+
+def run(args):
+    journal, done_keys = open_journal(args)
+    try:
+        with METRICS.timer("stage_seconds", stage="fetch"):
+            pokemon_list = asyncio.run(fetch_pokedex(args, journal, done_keys))
+    finally:
+        journal.close()
+    with METRICS.timer("stage_seconds", stage="assemble"):
+        write_pokedex(args, journal, pokemon_list)
+
+
+def write_pokedex(args, journal, pokemon_list):
+    # Assemble the output from the journal in /pokedex/all order, so a resumed
+    # run produces the same file as an uninterrupted one. The first pass keeps
+    # only journal offsets and the evolution graph; the second reads one row at
+    # a time and streams its entries straight to the output file.
+    offsets, evolution_graph = index_journal(journal, pokemon_list)
+
+    completed_pokemon = 0
+    seen_names = set()
+
+    pokemon_forms_mapping = {
+        "Flabébé": ["Flabebe-Orange", "Flabebe-Blue", "Flabebe-White", "Flabebe-Yellow"],
+        "Vivillon": ["Vivillon-Archipelago", "Vivillon-Continental", "Vivillon-Elegant", "Vivillon-Garden", "Vivillon-High Plains", "Vivillon-Icy Snow", "Vivillon-Jungle", "Vivillon-Marine", "Vivillon-Meadow", "Vivillon-Modern", "Vivillon-Monsoon", "Vivillon-Ocean", "Vivillon-Polar", "Vivillon-River", "Vivillon-Sandstorm", "Vivillon-Savanna", "Vivillon-Sun", "Vivillon-Tundra"]
+    }
+
+    with pipeline_from_args(args) as pipeline:
+        for pokemon in pokemon_list:
+            name = pokemon["name"]
+            key = Journal.key(pokemon["dex_number"], name)
+            details = journal.read_at(offsets[key])["details"] if key in offsets else None
+            # Entries finished while handling this row, in output order.
+            row_pokemon = []
+
+            if details:
+                # Forms share one parsed result; give each row its own abilities map to edit.
+                details = dict(details, abilities=dict(details["abilities"]))
+                details.pop("evolution_edges", None)
+
+                # Handle Pokémon with forms
+                forms = pokemon_forms_mapping.get(pokemon['name'])
+                if forms:
+                    original_pokemon = pokemon.copy()
+                    original_pokemon.update(details)
+
+                    # Sanitize the original Pokémon's name
+                    sanitized_original_name = original_pokemon['name'].replace('é', 'e')
+
+                    # Change the name of the original Pokémon
+                    if original_pokemon['name'] != sanitized_original_name:
+                        original_pokemon['name'] = sanitized_original_name
+                        details['abilities'][sanitized_original_name] = details['abilities'].pop(pokemon['name'])
+
+                    row_pokemon.append(original_pokemon)
+
+                    # Get the abilities of the original Pokémon
+                    original_abilities = details['abilities'].get(sanitized_original_name, [])
+
+                    # Handle Pokémon forms
+                    for form in forms:
+                        pokemon_form = pokemon.copy()
+                        pokemon_form['name'] = form
+
+                        # Add the original abilities to the form
+                        details['abilities'][form] = original_abilities
+
+                        pokemon_form.update(details)
+                        row_pokemon.append(pokemon_form)
+                else:
+                    if '(' in name:
+                        form_name = re.findall(r'\((.*?)\)', name)[0]
+                        pokemon['form_name'] = form_name
+
+                pokemon.update(details)
+                apply_canonical_name(pokemon)
+
+                row_pokemon.append(pokemon)
+
+                completed_pokemon += 1
+
+            for p in row_pokemon:
+                # The first entry carrying an evolved name gets the level and the
+                # species it evolves from, wherever in the dex that species is.
+                prevo = evolution_graph.prevo(p["name"])
+                if prevo and p["name"] not in seen_names:
+                    p["Evolves"] = evolution_graph.level(p["name"])
+                    p["evolves_from"] = canonical_name(prevo)
+                seen_names.add(p["name"])
+
+                if p['name'] != 'Palafin-Hero':
+                    pipeline.write(p)
+
+    print("Data extraction completed.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract the full Pokédex from pokemondb.net into pokemon_data.json")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import argparse
+import os
+import re
+from .aliases import apply_canonical_name, canonical_name
+from .fetch import add_fetch_arguments, fetcher_from_args
+from .journal import Journal, index_journal
+from .metrics import METRICS
+from .parsing import add_parser_arguments, get_evolution_edges, get_evolutions, get_gender, get_move_rows, get_pokemon_list, get_vitals, make_soup
+from .pipeline import add_output_arguments, output_path, pipeline_from_args
+from .selection import add_dex_argument, in_range
+
+
+####################
+##  Sanitize Name ##
+####################
+def sanitize_name(name, is_alt_form=False):
+    name = name.replace("♀", "-f").replace("♂", "-m")
+    name = re.sub(r"[^a-zA-Z0-9\s-]", "", name)  # Remove any special characters except spaces and hyphens
+    name = name.replace(" ", "-")  # Replace spaces with hyphens
+    name = name.replace("é", "e")  # Replace "é" with "e"
+    name = name.lower()
+    return name
+
+####################
+##  Get Base Name ##
+####################
+def get_base_name(name):
+    base_name = re.sub(r'\s\(.*\)', '', name)  # Remove form name from alternate forms
+    return base_name
+    
+##########################
+## GET MOVES FROM TABLE ##
+##########################
+def get_moves_from_table(moves_table):
+    moves = []
+    for level, move, move_type, power, accuracy in get_move_rows(moves_table):
+        move_data = {
+            "level": level if level and level.isdigit() else None,
+            "move": move,
+            "type": move_type,
+            "power": power,
+            "accuracy": accuracy
+        }
+        moves.append(move_data)
+
+    return moves
+
+####################
+##   GET MOVES    ##
+####################
+def get_moves(soup):
+    moves_tables = soup.find_all("table", class_="data-table")
+
+    moves = []
+    for moves_table in moves_tables:
+        moves.extend(get_moves_from_table(moves_table))
+
+    return moves
+
+####################
+##  GET DETAILS   ##
+####################      
+def get_pokemon_details(fetcher, url, backend=None, partial=True):
+    # Specific condition for Flabébé
+    if url.endswith("flabb"):
+        url = url[:-5] + "flabebe"
+    response = fetcher.get(url)
+    if response.status_code == 404:
+        print(f"Error: Page not found for URL: {url}")
+        return None
+    response.raise_for_status()
+    with METRICS.timer("parse_seconds", page="get_pokemon_details"):
+        soup = make_soup(response.text, "species_with_moves", backend, partial)
+
+        vitals = get_vitals(soup)
+    
+        if not vitals:
+            print(f"Error: Table not found for URL: {url}")
+            return None
+
+        moves = get_moves(soup)
+        gender = get_gender(soup)
+        evolutions = get_evolutions(soup)  # Retrieve evolution information
+        evolution_edges = get_evolution_edges(soup)  # Every arrow of the chart, for the evolution graph
+    
+    details = {
+        "species": vitals["species"],
+        "height": vitals["height"],
+        "weight": vitals["weight"],
+        "abilities": vitals["abilities"],
+        "local_no": vitals["local_no"],
+        "moves": moves,
+        "gender": gender,
+        "evolutions": evolutions,  # Include evolutions in the details
+        "evolution_edges": evolution_edges  # Spool only; dropped from the output
+    }
+
+    return details
+
+def add_arguments(parser):
+    add_fetch_arguments(parser, concurrent=False)
+    add_parser_arguments(parser)
+    add_dex_argument(parser)
+    add_output_arguments(parser)
+
+
+def run(args):
+    fetcher = fetcher_from_args(args)
+    # Parsed details are spooled to disk as they arrive, so only one row is held
+    # in memory at a time. The spool sits next to the output, so runs writing
+    # different files do not share one.
+    spool = Journal(os.path.splitext(output_path(args))[0] + ".spool.jsonl")
+    try:
+        extract(args, fetcher, spool)
+    finally:
+        spool.close()
+        if os.path.exists(spool.path):
+            os.remove(spool.path)
+        fetcher.close()
+
+
+def extract(args, fetcher, spool):
+    url = "https://pokemondb.net/pokedex/all"
+    response = fetcher.get(url)
+    response.raise_for_status()
+    pokemon_list = get_pokemon_list(response.text, args.parser, not args.full_parse)
+    pokemon_list = [pokemon for pokemon in pokemon_list if in_range(pokemon["dex_number"], args.dex)]
+
+    total_pokemon = len(pokemon_list)
+    completed_pokemon = 0
+
+    spool.open()
+    for pokemon in pokemon_list:
+        name = pokemon["name"]
+        base_name = get_base_name(name)
+        sanitized_name = sanitize_name(base_name)
+        pokedex_url = f"https://pokemondb.net/pokedex/{sanitized_name}"
+        details = get_pokemon_details(fetcher, pokedex_url, args.parser, not args.full_parse)
+
+        if details:
+            spool.append(Journal.key(pokemon["dex_number"], name), {"details": details})
+            completed_pokemon += 1
+            percentage = (completed_pokemon / total_pokemon) * 100
+            print(f"Progress: {completed_pokemon}/{total_pokemon} ({percentage:.2f}%) - {name}")
+    spool.close()
+
+    offsets, evolution_graph = index_journal(spool, pokemon_list)
+    seen_names = set()
+
+    with pipeline_from_args(args) as pipeline:
+        for pokemon in pokemon_list:
+            name = pokemon["name"]
+            key = Journal.key(pokemon["dex_number"], name)
+
+            if key in offsets:
+                details = spool.read_at(offsets[key])["details"]
+                details.pop("evolution_edges", None)
+                if '(' in name:
+                    form_name = re.findall(r'\((.*?)\)', name)[0]
+                    pokemon['form_name'] = form_name
+
+                pokemon.update(details)
+                apply_canonical_name(pokemon)
+                # Handle evolutions: the first entry with an evolved name gets the level
+                # and the species it evolves from.
+                prevo = evolution_graph.prevo(pokemon["name"])
+                if prevo and pokemon["name"] not in seen_names:
+                    pokemon["Evolves"] = evolution_graph.level(pokemon["name"])
+                    pokemon["evolves_from"] = canonical_name(prevo)
+                seen_names.add(pokemon["name"])
+
+                pipeline.write(pokemon)
+
+        print("Data extraction completed.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract the Pokédex from pokemondb.net into pokemon_data.json")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
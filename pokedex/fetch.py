@@ -0,0 +1,293 @@
+import asyncio
+import email.utils
+import random
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from .httpcache import CacheMiss, HttpCache
+from .metrics import METRICS
+from .transport import TRANSIENT_STATUSES, FetchError, HttpTransport, RecordingTransport, ReplayTransport, Response
+
+
+####################
+##    RETRIES     ##
+####################
+# Responses worth asking again for (transport.TRANSIENT_STATUSES) are also the
+# ones that mean "slow down" to the adaptive concurrency limit.
+
+
+def retry_after_seconds(value):
+    # A Retry-After header (delta seconds or an HTTP date) in seconds, or None.
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    # When and how long to wait before asking again.
+    #
+    # Connection errors, timeouts and TRANSIENT_STATUSES are retried up to `retries`
+    # times. The wait honours Retry-After when the response has one and is
+    # otherwise exponential from `backoff` seconds with equal jitter (between
+    # half and all of the step), so workers throttled together do not all come
+    # back at the same moment. Every wait is capped at max_backoff.
+    def __init__(self, retries=4, backoff=0.5, max_backoff=60.0):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def next_delay(self, attempt, response=None, error=None):
+        # Seconds to wait before attempt + 1, or None to give up (or to keep the response).
+        if attempt >= self.retries:
+            return None
+        if error is None and response.status_code not in TRANSIENT_STATUSES:
+            return None
+        retry_after = retry_after_seconds(response.headers.get("retry-after")) if response is not None else None
+        if retry_after is not None:
+            return min(retry_after, self.max_backoff)
+        step = min(self.max_backoff, self.backoff * 2 ** attempt)
+        return step / 2 + random.random() * step / 2
+
+
+def retry_reason(response, error):
+    return type(error).__name__ if error is not None else str(response.status_code)
+
+
+####################
+##   FETCHER      ##
+####################
+class Fetcher:
+    # Blocking fetcher shared by the extraction scripts, with an optional on-disk cache.
+    # Requests go through a transport (the network by default; see transport.py
+    # for recording and replaying a run). With base_url every request goes to
+    # rebase_url(url, base_url); the cache and the returned responses keep the
+    # original url. get() retries under the RetryPolicy; fetch_once() is a
+    # single attempt, for callers with their own loop.
+    def __init__(self, pool_size=10, cache=None, base_url=None, retry=None, timeout=30, transport=None):
+        self.cache = cache
+        self.retry = retry or RetryPolicy()
+        self.transport = transport or HttpTransport(pool_size, base_url, timeout)
+
+    @property
+    def offline(self):
+        return self.cache is not None and self.cache.offline
+
+    def _from_cache(self, url, entry):
+        headers = {"content-type": entry["content_type"]} if entry.get("content_type") else {}
+        return Response(url, entry["status"], self.cache.read_body(entry), headers, entry["encoding"])
+
+    def get(self, url):
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            response = error = None
+            try:
+                response = self.fetch_once(url)
+            except requests.RequestException as e:
+                error = e
+            delay = self.retry.next_delay(attempt, response, error)
+            if delay is None:
+                if error is not None:
+                    METRICS.inc("http_failures_total", host=host)
+                    raise FetchError(f"{url}: {error}") from error
+                return response
+            METRICS.inc("http_retries_total", host=host, reason=retry_reason(response, error))
+            time.sleep(delay)
+            attempt += 1
+
+    def fetch_once(self, url):
+        host = urlsplit(url).netloc
+        entry = self.cache.lookup(url) if self.cache else None
+        if self.offline:
+            if entry is None:
+                METRICS.inc("cache_lookups_total", result="miss")
+                raise CacheMiss(f"Not in cache (offline mode): {url}")
+            METRICS.inc("cache_lookups_total", result="hit")
+            return self._from_cache(url, entry)
+
+        request_headers = self.cache.conditional_headers(entry) if entry else {}
+        with METRICS.timer("http_request_seconds", host=host):
+            response = self.transport.send(url, request_headers)
+        METRICS.inc("http_responses_total", host=host, status=response.status_code)
+        METRICS.inc("http_bytes_total", len(response.content), host=host)
+        if self.cache:
+            # revalidated: a 304 for a cached page; changed: cached, but the page was sent again.
+            result = "revalidated" if response.status_code == 304 and entry else "changed" if entry else "miss"
+            METRICS.inc("cache_lookups_total", result=result)
+        if response.status_code == 304 and entry:
+            self.cache.mark_validated(url, entry)
+            return self._from_cache(url, entry)
+
+        # Error pages and throttling responses are never cached; 404s are, since
+        # a missing move page stays missing.
+        if self.cache and (response.status_code == 200 or response.status_code == 404):
+            self.cache.store(url, response.status_code, response.content, response.headers, response.encoding)
+        return response
+
+    def close(self):
+        self.transport.close()
+        # Offline hits never revalidate, so an offline run would age out the
+        # very cache it depends on; only online runs evict.
+        if self.cache and not self.offline:
+            self.cache.evict()
+
+
+####################
+##  RATE LIMITER  ##
+####################
+class HostRateLimiter:
+    # Spaces out request start times so no host sees more than `rate` requests per second.
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_slot = {}
+        self.lock = asyncio.Lock()
+
+    async def wait(self, host):
+        if not self.interval:
+            return
+        async with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot.get(host, now))
+            self.next_slot[host] = slot + self.interval
+        if slot > now:
+            METRICS.observe("rate_limit_wait_seconds", slot - now, host=host)
+            await asyncio.sleep(slot - now)
+
+    def defer(self, host, delay):
+        # Hold every request to host for delay seconds (a Retry-After from the site).
+        now = time.monotonic()
+        self.next_slot[host] = max(self.next_slot.get(host, now), now + delay)
+
+
+####################
+##  AIMD LIMIT    ##
+####################
+class AdaptiveLimit:
+    # Concurrency limit that adapts to the site, TCP style.
+    #
+    # Every throttled or failed request halves the limit (at most once per
+    # `cooldown` seconds, so one burst of 429s counts once); every healthy one
+    # adds 1/limit, about one slot per limit's worth of responses, up to
+    # `maximum`. Used as `async with limit:` around each request.
+    def __init__(self, maximum, cooldown=1.0):
+        self.maximum = maximum
+        self.limit = float(maximum)
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.last_decrease = None
+        self.condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def record(self, throttled):
+        now = time.monotonic()
+        if throttled:
+            METRICS.inc("throttled_total")
+            if self.last_decrease is None or now - self.last_decrease >= self.cooldown:
+                self.limit = max(1.0, self.limit / 2)
+                self.last_decrease = now
+        else:
+            self.limit = min(float(self.maximum), self.limit + 1 / self.limit)
+        METRICS.set("concurrency_limit", self.limit)
+
+
+####################
+##  ASYNC FETCHER ##
+####################
+class AsyncFetcher:
+    # Runs blocking fetches in worker threads, bounded by an adaptive
+    # concurrency limit and a per-host rate limit. Retries follow the fetcher's
+    # RetryPolicy, but wait outside the limit, so a throttled request does not
+    # hold a slot while it backs off.
+    def __init__(self, fetcher=None, concurrency=8, rate=5.0):
+        self.fetcher = fetcher or Fetcher(pool_size=concurrency)
+        self.limit = AdaptiveLimit(concurrency)
+        self.limiter = HostRateLimiter(rate)
+
+    async def get(self, url):
+        host = urlsplit(url).netloc
+        attempt = 0
+        while True:
+            response = error = None
+            async with self.limit:
+                await self.limiter.wait(host)
+                METRICS.add("requests_in_flight", 1)
+                try:
+                    response = await asyncio.to_thread(self.fetcher.fetch_once, url)
+                except requests.RequestException as e:
+                    error = e
+                finally:
+                    METRICS.add("requests_in_flight", -1)
+            self.limit.record(throttled=error is not None or response.status_code in TRANSIENT_STATUSES)
+
+            delay = self.fetcher.retry.next_delay(attempt, response, error)
+            if delay is None:
+                if error is not None:
+                    METRICS.inc("http_failures_total", host=host)
+                    raise FetchError(f"{url}: {error}") from error
+                return response
+            METRICS.inc("http_retries_total", host=host, reason=retry_reason(response, error))
+            if response is not None and response.headers.get("retry-after"):
+                self.limiter.defer(host, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def close(self):
+        self.fetcher.close()
+
+
+def add_fetch_arguments(parser, concurrent=True):
+    if concurrent:
+        parser.add_argument("--concurrency", type=int, default=8, help="maximum number of requests in flight (halved while the site throttles, then raised again)")
+        parser.add_argument("--rate", type=float, default=5.0, help="maximum requests per second per host (0 disables)")
+    parser.add_argument("--cache-dir", default=".http_cache", help="directory of the on-disk response cache")
+    parser.add_argument("--no-cache", action="store_true", help="always download pages, bypassing the cache")
+    parser.add_argument("--offline", action="store_true", help="serve every page from the cache, never touching the network")
+    parser.add_argument("--cache-max-age", type=float, default=30, help="evict cache entries not revalidated for this many days")
+    parser.add_argument("--retries", type=int, default=4, help="retries for throttled, failed or unreachable requests")
+    parser.add_argument("--backoff", type=float, default=0.5, help="first retry wait in seconds, doubled on every retry unless the site sends Retry-After")
+    parser.add_argument("--base-url", help="fetch https://host/path from BASE_URL/host/path instead, e.g. a local stub server")
+    recording = parser.add_mutually_exclusive_group()
+    recording.add_argument("--record", metavar="ARCHIVE", help="save every response of the run into ARCHIVE (a zip) for --replay")
+    recording.add_argument("--replay", metavar="ARCHIVE", help="serve every request from a --record archive, never touching the network or the cache")
+
+
+def fetcher_from_args(args, pool_size=10):
+    if args.offline and args.no_cache:
+        raise ValueError("--offline needs the cache; drop --no-cache")
+    if args.replay and args.offline:
+        raise ValueError("--replay never uses the cache; drop --offline")
+    transport = HttpTransport(pool_size, args.base_url)
+    if args.record:
+        transport = RecordingTransport(transport, args.record)
+    elif args.replay:
+        transport = ReplayTransport(args.replay)
+    cache = None
+    # A replay is the recorded run exactly, whatever the cache holds.
+    if not args.no_cache and not args.replay:
+        cache = HttpCache(args.cache_dir, max_age=args.cache_max_age * 86400, offline=args.offline)
+    return Fetcher(cache=cache, retry=RetryPolicy(args.retries, args.backoff), transport=transport)
+
+
+def async_fetcher_from_args(args):
+    fetcher = fetcher_from_args(args, pool_size=args.concurrency)
+    # Offline and replayed runs only read local files, so there is nothing to rate limit.
+    rate = 0 if fetcher.offline or isinstance(fetcher.transport, ReplayTransport) else args.rate
+    return AsyncFetcher(fetcher, concurrency=args.concurrency, rate=rate)
@@ -0,0 +1,152 @@
+import argparse
+import json
+from collections import Counter
+
+from .aliases import toid
+from .movecatalog import load_pokedex
+
+
+FORMAT_NAME = "fuzzy-index-v1"
+# Candidates kept from the trigram pass for the edit-distance rerank.
+CANDIDATES = 16
+
+
+def trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(query, candidate):
+    # (distance to the whole candidate, distance to its closest prefix) using
+    # optimal string alignment: insertions, deletions, substitutions and swaps
+    # of neighbouring letters ("dargon" -> "dragon") all cost 1. The prefix
+    # distance is the minimum of the last row, so one table gives both.
+    width = len(candidate)
+    previous2 = None
+    previous = list(range(width + 1))
+    for i, q in enumerate(query, 1):
+        current = [i]
+        append = current.append
+        for j, c in enumerate(candidate, 1):
+            value = previous[j - 1] if q == c else previous[j - 1] + 1
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if previous2 is not None and j > 1 and q == candidate[j - 2] and query[i - 2] == c and previous2[j - 2] + 1 < value:
+                value = previous2[j - 2] + 1
+            append(value)
+        previous2, previous = previous, current
+    return previous[-1], min(previous)
+
+
+####################
+##  FUZZY INDEX   ##
+####################
+class FuzzyIndex:
+    # Trigram index over Showdown ids of names, with an edit-distance rerank.
+    #
+    # Each term is [text, kind, target]: the name to show, what it names
+    # (pokemon, form, move or item) and the entry it leads to (a form label
+    # leads to its entry, everything else to itself). A search counts shared
+    # trigrams through the posting lists, keeps the best CANDIDATES and orders
+    # those by edit distance, so only a handful of distances are computed.
+    def __init__(self, terms, postings=None):
+        self.terms = terms
+        self.keys = [toid(text) for text, _, _ in terms]
+        if postings is None:
+            postings = {}
+            for term_id, key in enumerate(self.keys):
+                for gram in trigrams(key):
+                    postings.setdefault(gram, []).append(term_id)
+        self.postings = postings
+
+    @classmethod
+    def build(cls, entries, items=None):
+        # entries: extracted pokedex entries; items: the items.json mapping (or None).
+        terms = []
+        seen = set()
+
+        def add(text, kind, target=None):
+            if text and (toid(text), kind) not in seen:
+                seen.add((toid(text), kind))
+                terms.append([text, kind, target or text])
+
+        for entry in entries:
+            add(entry["name"], "pokemon")
+        for entry in entries:
+            add(entry.get("form_name"), "form", entry["name"])
+        for entry in entries:
+            moves = entry.get("moves") or {}
+            for move_data in moves.values() if isinstance(moves, dict) else moves:
+                add(move_data["move"], "move")
+        for item_name in items or {}:
+            add(item_name, "item")
+        return cls(terms)
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"format": FORMAT_NAME, "terms": self.terms, "postings": self.postings}, f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != FORMAT_NAME:
+            raise ValueError(f"{path} is not a {FORMAT_NAME} file")
+        return cls(data["terms"], data["postings"])
+
+    def __len__(self):
+        return len(self.terms)
+
+    def search(self, query, k=5, kinds=None):
+        # Up to k (text, kind, target, distance) tuples, best first. A query
+        # that is a prefix of a name ranks that name as if it were one edit
+        # away, so partial input autocompletes.
+        key = toid(query)
+        if not key:
+            return []
+        shared = Counter()
+        for gram in trigrams(key):
+            shared.update(self.postings.get(gram, ()))
+        if kinds is not None:
+            shared = Counter({term_id: count for term_id, count in shared.items() if self.terms[term_id][1] in kinds})
+
+        ranked = []
+        for term_id, count in shared.most_common(CANDIDATES):
+            candidate = self.keys[term_id]
+            distance, prefix_distance = edit_distance(key, candidate)
+            ranked.append((min(distance, prefix_distance + 1), distance, -count, candidate, term_id))
+        ranked.sort()
+        return [(*self.terms[term_id], distance) for _, distance, _, _, term_id in ranked[:k]]
+
+
+def add_arguments(parser):
+    parser.add_argument("pokedex", help="pokedex file (json, ndjson or normalized)")
+    parser.add_argument("--items", help="items.json to include item names")
+    parser.add_argument("--output", default="fuzzy_index.json", help="index file to write")
+    parser.add_argument("--query", help="print the top suggestions for this text after building")
+
+
+def run(args):
+    items = None
+    if args.items:
+        with open(args.items, encoding="utf-8") as f:
+            items = json.load(f)
+    index = FuzzyIndex.build(load_pokedex(args.pokedex), items)
+    index.save(args.output)
+    print(f"Indexed {len(index)} names into {args.output}")
+
+    if args.query:
+        for text, kind, target, distance in index.search(args.query):
+            print(f"{text} ({kind}{', ' + target if target != text else ''}) distance {distance}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the fuzzy name index for pokemon, forms, moves and items")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
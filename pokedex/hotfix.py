@@ -0,0 +1,33 @@
+import argparse
+import json
+from tqdm import tqdm
+
+from .pipeline import fix_abilities
+
+def rename_abilities(json_file):
+    with open(json_file, 'r') as f:
+        data = json.load(f)
+
+    # Same reshaping that extendedextractor.py --fix-abilities applies while writing
+    data = [fix_abilities(entry) for entry in tqdm(data, desc="Processing entries", unit="entry")]
+
+    with open(json_file, 'w') as f:
+        json.dump(data, f, indent=4)
+
+
+def add_arguments(parser):
+    parser.add_argument("path", nargs="?", default="pokemon_data.json", help="extracted file to fix in place")
+
+
+def run(args):
+    rename_abilities(args.path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Reduce each entry's abilities to those of its own form")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
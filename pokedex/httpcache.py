@@ -0,0 +1,116 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+
+class CacheMiss(Exception):
+    pass
+
+
+####################
+##  HTTP CACHE    ##
+####################
+class HttpCache:
+    # On-disk response cache.
+    #
+    #   <path>/objects/ab/abcdef....gz   gzip-compressed bodies, named by the sha256 of the body
+    #   <path>/index/12/1234....json     one metadata record per URL (status, validators, body digest)
+    #
+    # Pages that did not change between runs share a single object, and a
+    # revalidated entry only rewrites its small index record.
+    def __init__(self, path=".http_cache", max_age=None, offline=False):
+        self.path = path
+        self.max_age = max_age
+        self.offline = offline
+        os.makedirs(os.path.join(path, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(path, "index"), exist_ok=True)
+
+    def _index_path(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.path, "index", key[:2], key + ".json")
+
+    def _object_path(self, digest):
+        return os.path.join(self.path, "objects", digest[:2], digest + ".gz")
+
+    def _write_atomic(self, path, data):
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def lookup(self, url):
+        try:
+            with open(self._index_path(url), "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def read_body(self, entry):
+        with gzip.open(self._object_path(entry["body"]), "rb") as f:
+            return f.read()
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url, status_code, content, headers, encoding):
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        if not os.path.exists(object_path):
+            self._write_atomic(object_path, gzip.compress(content))
+
+        now = time.time()
+        entry = {
+            "url": url,
+            "status": status_code,
+            "etag": headers.get("etag"),
+            "last_modified": headers.get("last-modified"),
+            "content_type": headers.get("content-type"),
+            "encoding": encoding,
+            "body": digest,
+            "stored_at": now,
+            "validated_at": now,
+        }
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode("utf-8"))
+        return entry
+
+    def mark_validated(self, url, entry):
+        entry["validated_at"] = time.time()
+        self._write_atomic(self._index_path(url), json.dumps(entry).encode("utf-8"))
+
+    def evict(self):
+        # Drop entries not revalidated within max_age seconds, then any body no entry points at.
+        now = time.time()
+        referenced = set()
+        index_root = os.path.join(self.path, "index")
+        for directory, _, files in os.walk(index_root):
+            for filename in files:
+                path = os.path.join(directory, filename)
+                try:
+                    with open(path, "r") as f:
+                        entry = json.load(f)
+                except ValueError:
+                    os.remove(path)
+                    continue
+                if self.max_age is not None and now - entry["validated_at"] > self.max_age:
+                    os.remove(path)
+                else:
+                    referenced.add(entry["body"])
+
+        removed = 0
+        objects_root = os.path.join(self.path, "objects")
+        for directory, _, files in os.walk(objects_root):
+            for filename in files:
+                if filename[:-len(".gz")] not in referenced:
+                    os.remove(os.path.join(directory, filename))
+                    removed += 1
+        return removed
@@ -0,0 +1,172 @@
+import argparse
+import asyncio
+from bs4 import BeautifulSoup
+import json
+import os
+import re
+import unidecode
+from .fetch import add_fetch_arguments, async_fetcher_from_args
+from .metrics import METRICS
+from .parsepool import ParsePool
+from .selection import in_range, parse_range
+
+# Function to replace non-alphabetic characters
+def clean_item_name(item_name):
+    return unidecode.unidecode(item_name.strip())  # Add .strip() to remove newline and extra spaces
+
+
+# Function to extract items from the wiki page
+def parse_items_page(html, generation):
+    # {item name: {"Image", "Generation": [generation]}} for one generation's page.
+    soup = BeautifulSoup(html, "html.parser")
+    tables = soup.find_all("table", lambda value: value and "sortable" in value and "roundy" in value)
+
+    target_table = None
+    for table in tables:
+        header_row = table.find("tr")
+        if header_row and (len(header_row.find_all("th")) == 4 or len(header_row.find_all("th")) == 5):
+            target_table = table
+            break
+
+    if target_table is None:
+        print(f"Table not found for {generation}")
+        return {}
+
+    items = {}
+    rows = target_table.find_all("tr")
+
+    for row in rows[1:]: 
+        cols = row.find_all("td")
+        item_image = cols[2].find("img")["src"]
+        item_name = clean_item_name(cols[3].text)
+
+        if item_name in items:
+            items[item_name]["Image"] = item_image
+        else:
+            items[item_name] = {
+                "Image": item_image,
+                "Generation": [generation]
+            }
+    return items
+
+
+def merge_items(all_items, items, generation):
+    # Items seen on an earlier page only gain the generation; new ones are added.
+    for item_name, item in items.items():
+        if item_name in all_items:
+            if generation not in all_items[item_name]["Generation"]:
+                all_items[item_name]["Generation"].append(generation)
+        else:
+            all_items[item_name] = item
+
+
+def generation_number(generation):
+    return int(generation[3:])
+
+
+def combine_items(partials):
+    # {generation: items of that page} -> one dict, whatever order the pages
+    # finished in. Pages are merged newest first, so every item keeps the image
+    # of the newest generation it appears in and lists its generations newest first.
+    all_items = {}
+    for generation in sorted(partials, key=generation_number, reverse=True):
+        merge_items(all_items, partials[generation], generation)
+    return all_items
+
+
+# Item pages, newest generation first
+ITEM_PAGES = [
+    {
+        "url": "https://bulbapedia.bulbagarden.net/wiki/List_of_items_by_index_number_(Generation_IX)",
+        "generation": "Gen9"
+    },
+    {
+        "url": "https://bulbapedia.bulbagarden.net/wiki/List_of_items_by_index_number_(Generation_VIII)",
+        "generation": "Gen8"
+    },
+    {
+        "url": "https://bulbapedia.bulbagarden.net/wiki/List_of_items_by_index_number_(Generation_VII)",
+        "generation": "Gen7"
+    },   
+    {
+        "url": "https://bulbapedia.bulbagarden.net/wiki/List_of_items_by_index_number_(Generation_VI)",
+        "generation": "Gen6"
+    },
+    {
+        "url": "https://bulbapedia.bulbagarden.net/wiki/List_of_items_by_index_number_(Generation_V)",
+        "generation": "Gen5"
+    },    
+    {
+        "url": "https://bulbapedia.bulbagarden.net/wiki/List_of_items_by_index_number_(Generation_IV)",
+        "generation": "Gen4"
+    }, 
+    {
+        "url": "https://bulbapedia.bulbagarden.net/wiki/List_of_items_by_index_number_(Generation_III)",
+        "generation": "Gen3"
+    } 
+]
+
+
+def item_pages(generations=(None, None)):
+    return [page for page in ITEM_PAGES if in_range(generation_number(page["generation"]), generations)]
+
+
+async def get_items_page(fetcher, parse_pool, url_info):
+    response = await fetcher.get(url_info["url"])
+    response.raise_for_status()
+    items = await parse_pool.submit(parse_items_page, response.content, url_info["generation"])
+    return url_info["generation"], items
+
+
+async def fetch_items(fetcher, pages=ITEM_PAGES, workers=0, parse_pool=None):
+    # Every page is fetched and parsed on its own into a partial result; the
+    # partials are only combined once all of them are in. Pass a parse_pool to
+    # share it with other jobs; otherwise one is made (and closed) here.
+    own_pool = parse_pool is None
+    if own_pool:
+        parse_pool = ParsePool(workers)
+    partials = {}
+    try:
+        page_tasks = [get_items_page(fetcher, parse_pool, url_info) for url_info in pages]
+        for index, page_task in enumerate(asyncio.as_completed(page_tasks), start=1):
+            generation, partials[generation] = await page_task
+            progress = (index / len(pages)) * 100
+            print(f"Processed {generation} ({index}/{len(pages)}): {progress:.2f}%")
+    finally:
+        if own_pool:
+            await parse_pool.close()
+    return combine_items(partials)
+
+
+def write_items(path, all_items):
+    # Save items to a JSON file
+    with open(path, "w") as file:
+        json.dump(all_items, file, indent=4)
+
+
+def add_arguments(parser):
+    add_fetch_arguments(parser)
+    parser.add_argument("--gens", type=parse_range, default=(None, None), metavar="RANGE", help="only these generations' item pages, e.g. 8-9")
+    parser.add_argument("--workers", type=int, default=min(len(ITEM_PAGES), os.cpu_count()), help="parser processes (0 parses in the main process)")
+    parser.add_argument("--output", default="items.json", help="output file")
+
+
+def run(args):
+    fetcher = async_fetcher_from_args(args)
+    try:
+        with METRICS.timer("stage_seconds", stage="fetch"):
+            all_items = asyncio.run(fetch_items(fetcher, item_pages(args.gens), args.workers))
+    finally:
+        fetcher.close()
+    with METRICS.timer("stage_seconds", stage="write_items"):
+        write_items(args.output, all_items)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extract every Gen 3 - Gen 9 item from Bulbapedia into items.json")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
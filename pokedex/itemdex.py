@@ -0,0 +1,165 @@
+import argparse
+import json
+import os
+from functools import cached_property
+
+from .item import clean_item_name, generation_number
+
+
+FORMAT_NAME = "item-index-v1"
+
+
+def item_key(name):
+    # Case- and accent-insensitive key, so "poke ball", "Poké Ball" and the
+    # stored "Poke Ball" all land on the same item.
+    return clean_item_name(name).casefold()
+
+
+def generation_bit(generation):
+    # 9 or "Gen9" -> the bit for that generation in an availability mask.
+    if isinstance(generation, str):
+        generation = generation_number(generation)
+    return 1 << generation
+
+
+def mask_generations(mask):
+    # Availability mask -> ["Gen9", "Gen8", ...], newest first like items.json.
+    return [f"Gen{generation}" for generation in range(mask.bit_length() - 1, -1, -1) if mask >> generation & 1]
+
+
+####################
+##   ITEM INDEX   ##
+####################
+class ItemIndex:
+    # Item availability with one integer bitmask per item.
+    #
+    # Bit N of masks[i] is set when names[i] is in Generation N, so a legality
+    # check is one dict lookup and one AND. Lookups go through item_key. The
+    # generation -> items index is built from the masks on first use. The
+    # saved form keeps the names, the image urls without their shared prefix
+    # and the masks as plain integers.
+    def __init__(self, names, images, masks):
+        self.names = names
+        self.images = images
+        self.masks = masks
+        self._by_key = {}
+        for i, name in enumerate(names):
+            self._by_key.setdefault(item_key(name), i)
+
+    @classmethod
+    def from_items(cls, items):
+        # items: the items.json mapping of name -> {"Image", "Generation"}.
+        names = list(items)
+        images = [items[name]["Image"] for name in names]
+        masks = []
+        for name in names:
+            mask = 0
+            for generation in items[name]["Generation"]:
+                mask |= generation_bit(generation)
+            masks.append(mask)
+        return cls(names, images, masks)
+
+    def save(self, path):
+        prefix = os.path.commonprefix(self.images)
+        data = {
+            "format": FORMAT_NAME,
+            "image_prefix": prefix,
+            "names": self.names,
+            "images": [image[len(prefix):] for image in self.images],
+            "masks": self.masks,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path):
+        # Either a saved index or items.json itself.
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("format") != FORMAT_NAME:
+            return cls.from_items(data)
+        prefix = data["image_prefix"]
+        return cls(data["names"], [prefix + image for image in data["images"]], data["masks"])
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return item_key(name) in self._by_key
+
+    @cached_property
+    def _by_generation(self):
+        index = {}
+        for i, mask in enumerate(self.masks):
+            generation = 0
+            while mask:
+                if mask & 1:
+                    index.setdefault(generation, []).append(self.names[i])
+                mask >>= 1
+                generation += 1
+        return index
+
+    def resolve(self, name):
+        # The stored spelling of an item name, or None.
+        i = self._by_key.get(item_key(name))
+        return None if i is None else self.names[i]
+
+    def get(self, name):
+        # The items.json record for a name, or None.
+        i = self._by_key.get(item_key(name))
+        if i is None:
+            return None
+        return {"Image": self.images[i], "Generation": mask_generations(self.masks[i])}
+
+    @cached_property
+    def covered(self):
+        # Mask of every generation the item data has pages for (Gen3-9 from Bulbapedia).
+        mask = 0
+        for item_mask in self.masks:
+            mask |= item_mask
+        return mask
+
+    def covers(self, generation):
+        # Whether availability in this generation is known at all.
+        return bool(self.covered & generation_bit(generation))
+
+    def is_legal(self, name, generation):
+        i = self._by_key.get(item_key(name))
+        return i is not None and bool(self.masks[i] & generation_bit(generation))
+
+    def generations(self, name):
+        i = self._by_key.get(item_key(name))
+        return [] if i is None else mask_generations(self.masks[i])
+
+    def in_generation(self, generation):
+        # Every item available in a generation, in items.json order.
+        if isinstance(generation, str):
+            generation = generation_number(generation)
+        return list(self._by_generation.get(generation, ()))
+
+    def to_items(self):
+        return {name: {"Image": image, "Generation": mask_generations(mask)} for name, image, mask in zip(self.names, self.images, self.masks)}
+
+
+def add_arguments(parser):
+    parser.add_argument("items", help="items.json written by the item extractor")
+    parser.add_argument("--output", default="items.index.json", help="index file to write")
+
+
+def run(args):
+    index = ItemIndex.load(args.items)
+    index.save(args.output)
+    print(f"Indexed {len(index)} items into {args.output}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the compact item index used for item legality checks")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
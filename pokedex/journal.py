@@ -0,0 +1,92 @@
+import json
+import os
+
+from .evolution import EvolutionGraph
+
+
+####################
+##    JOURNAL     ##
+####################
+class Journal:
+    # Append-only JSONL checkpoint with one line per finished Pokédex row,
+    # keyed by dex number and name. Each line is flushed as it is written, so
+    # an interrupted run keeps everything that completed before it stopped.
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+
+    @staticmethod
+    def key(dex_number, name):
+        return f"{dex_number}:{name}"
+
+    def records(self):
+        # Yields (offset, record) for every complete line, in the order they were written.
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash; its row is fetched again.
+                    record = None
+                if record is not None:
+                    yield offset, record
+                offset += len(line)
+
+    def __iter__(self):
+        for _, record in self.records():
+            yield record
+
+    def keys(self):
+        # Keys of the finished rows, without holding on to their records.
+        return {record["key"] for record in self}
+
+    def load(self):
+        return {record["key"]: record for record in self}
+
+    def read_at(self, offset):
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def open(self, resume=False):
+        if resume and os.path.exists(self.path):
+            self._drop_partial_line()
+            self.file = open(self.path, "a", encoding="utf-8")
+        else:
+            self.file = open(self.path, "w", encoding="utf-8")
+        return self
+
+    def _drop_partial_line(self):
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+
+    def append(self, key, record):
+        record = {"key": key, **record}
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+def index_journal(journal, pokemon_list):
+    # One pass over the journal for the row assembly: the offset of every row
+    # in pokemon_list, and the evolution graph built from every chart on the
+    # journaled species pages.
+    row_keys = {Journal.key(p["dex_number"], p["name"]) for p in pokemon_list}
+    offsets = {}
+    evolution_graph = EvolutionGraph()
+    for offset, record in journal.records():
+        if record["key"] not in row_keys:
+            continue
+        offsets[record["key"]] = offset
+        for source, target, level in record["details"].get("evolution_edges", []):
+            evolution_graph.add(source, target, level)
+    return offsets, evolution_graph
@@ -0,0 +1,252 @@
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+
+from .aliases import toid
+from .dexquery import entry_abilities
+from .evolution import EvolutionGraph
+from .itemdex import ItemIndex
+from .movecatalog import load_pokedex
+
+
+MAX_GENERATION = 9
+ANY_GENERATION = 0
+
+
+####################
+##  PASTE PARSER  ##
+####################
+def parse_paste(text):
+    # Showdown export/import text -> list of sets. Only the fields the engine
+    # checks are kept: species, nickname, gender, item, ability, level and moves.
+    sets = []
+    current = None
+    for raw_line in text.splitlines():
+        line = raw_line.strip()
+        if not line:
+            current = None
+            continue
+        if current is None:
+            if line.startswith("===") or line.endswith("==="):
+                # Team headers of a multi-team export.
+                continue
+            current = _parse_header(line)
+            sets.append(current)
+        elif line.startswith("-"):
+            current["moves"].append(line[1:].strip())
+        elif line.startswith("Ability:"):
+            current["ability"] = line[len("Ability:"):].strip()
+        elif line.startswith("Level:"):
+            current["level"] = int(line[len("Level:"):].strip())
+    return sets
+
+
+def _parse_header(line):
+    # "Nickname (Species) (M) @ Item", every part but the species optional.
+    name, _, item = line.partition(" @ ")
+    name = name.strip()
+    gender = None
+    for suffix, value in (("(M)", "M"), ("(F)", "F")):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)].strip()
+            gender = value
+    nickname = None
+    if name.endswith(")") and " (" in name:
+        nickname, _, species = name[:-1].rpartition(" (")
+    else:
+        species = name
+    return {
+        "species": species,
+        "nickname": nickname,
+        "gender": gender,
+        "item": item.strip() or None,
+        "ability": None,
+        "level": None,
+        "moves": [],
+    }
+
+
+def split_teams(text):
+    # A multi-team export separates teams with "=== [format] Name ===" lines.
+    teams, current = [], []
+    for line in text.splitlines():
+        if line.strip().startswith("===") and current:
+            teams.append("\n".join(current))
+            current = []
+        current.append(line)
+    if any(line.strip() for line in current):
+        teams.append("\n".join(current))
+    return teams
+
+
+####################
+##    ENGINE      ##
+####################
+class LegalityEngine:
+    # Compiled legality tables.
+    #
+    # Every move id gets a bit. Each species gets one int bitset per generation
+    # (index 0 is the union over all generations) and a frozenset of ability
+    # ids, so a check is a couple of dict lookups and one AND. Learnsets include
+    # the moves of every pre-evolution, which an evolved Pokémon keeps. The tables
+    # are plain dicts, ints and frozensets and pickle cheaply into worker processes.
+    # With an itemdex.ItemIndex, held items are checked against their generations too.
+    def __init__(self, move_bits, species, items=None):
+        self.move_bits = move_bits
+        self.species = species
+        self.items = items
+
+    @classmethod
+    def compile(cls, entries, inherit=True, items=None):
+        move_bits = {}
+        own_learnsets = {}
+        for entry in entries:
+            learnsets = [0] * (MAX_GENERATION + 1)
+            moves = entry.get("moves") or {}
+            for move_data in moves.values() if isinstance(moves, dict) else moves:
+                bit = 1 << move_bits.setdefault(toid(move_data["move"]), len(move_bits))
+                learnsets[ANY_GENERATION] |= bit
+                for gen in move_data.get("generations", ()):
+                    learnsets[gen] |= bit
+            own_learnsets.setdefault(entry["name"], learnsets)
+
+        graph = EvolutionGraph.from_entries(entries) if inherit else EvolutionGraph()
+        inherited = graph.inherit(own_learnsets, lambda a, b: [x | y for x, y in zip(a, b)])
+        # Alternate forms are not in the evolution charts; they inherit through their base entry.
+        base_names = {}
+        for entry in entries:
+            base_names.setdefault(entry["dex_number"], entry["name"])
+
+        species = {}
+        for entry in entries:
+            name = entry["name"]
+            learnsets = own_learnsets[name]
+            prevo = graph.prevo(name if name in graph else base_names[entry["dex_number"]])
+            if prevo in inherited:
+                learnsets = [x | y for x, y in zip(learnsets, inherited[prevo])]
+            abilities = frozenset(toid(ability) for ability in entry_abilities(entry))
+            species[toid(name)] = (learnsets, abilities)
+        return cls(move_bits, species, items)
+
+    @classmethod
+    def load(cls, path, items_path=None):
+        # items_path: items.json or a saved item index.
+        items = ItemIndex.load(items_path) if items_path else None
+        return cls.compile(load_pokedex(path), items=items)
+
+    def can_learn(self, species, move, gen=ANY_GENERATION):
+        if not ANY_GENERATION <= gen <= MAX_GENERATION:
+            raise ValueError(f"Unknown generation: {gen}")
+        tables = self.species.get(toid(species))
+        bit = self.move_bits.get(toid(move))
+        if tables is None or bit is None:
+            return False
+        return bool(tables[0][gen] >> bit & 1)
+
+    def has_ability(self, species, ability):
+        tables = self.species.get(toid(species))
+        return tables is not None and toid(ability) in tables[1]
+
+    def validate_set(self, pokemon_set, gen=MAX_GENERATION):
+        # Returns a list of problems; an empty list means the set is legal.
+        problems = []
+        species = pokemon_set["species"]
+        # A negative gen would index the learnsets from the end.
+        if not ANY_GENERATION <= gen <= MAX_GENERATION:
+            return [f"Generation {gen} is not between 1 and {MAX_GENERATION}"]
+        tables = self.species.get(toid(species))
+        if tables is None:
+            return [f"{species} is not in the pokedex"]
+        learnset, abilities = tables[0][gen], tables[1]
+
+        ability = pokemon_set.get("ability")
+        if ability and abilities and toid(ability) not in abilities:
+            problems.append(f"{species} can't have {ability}")
+
+        item = pokemon_set.get("item")
+        if item and self.items is not None:
+            if item not in self.items:
+                problems.append(f"{item} is not a known item")
+            # The item lists start in Gen 3, so earlier generations are not checked.
+            elif gen != ANY_GENERATION and self.items.covers(gen) and not self.items.is_legal(item, gen):
+                problems.append(f"{item} is not available in generation {gen}")
+
+        moves = pokemon_set.get("moves", [])
+        if len(moves) > 4:
+            problems.append(f"{species} has more than 4 moves")
+        seen = set()
+        for move in moves:
+            mid = toid(move)
+            if mid in seen:
+                problems.append(f"{species} has {move} more than once")
+                continue
+            seen.add(mid)
+            bit = self.move_bits.get(mid)
+            if bit is None:
+                problems.append(f"{move} is not a known move")
+            elif not learnset >> bit & 1:
+                problems.append(f"{species} can't learn {move} in generation {gen}")
+        return problems
+
+    def validate_team(self, team, gen=MAX_GENERATION):
+        # team is a Showdown paste or a list of already parsed sets.
+        sets = parse_paste(team) if isinstance(team, str) else team
+        problems = []
+        if len(sets) > 6:
+            problems.append("Team has more than 6 Pokémon")
+        for pokemon_set in sets:
+            problems.extend(self.validate_set(pokemon_set, gen))
+        return problems
+
+    def validate_teams(self, teams, gen=MAX_GENERATION, workers=0, chunksize=64):
+        # Problems for every team, in order. workers > 0 validates in a process pool.
+        if not workers:
+            return [self.validate_team(team, gen) for team in teams]
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self.move_bits, self.species, self.items)) as executor:
+            return list(executor.map(_validate_in_worker, teams, [gen] * len(teams), chunksize=chunksize))
+
+
+# Each pool worker receives the compiled tables once, through the initializer.
+_worker_engine = None
+
+
+def _init_worker(move_bits, species, items):
+    global _worker_engine
+    _worker_engine = LegalityEngine(move_bits, species, items)
+
+
+def _validate_in_worker(team, gen):
+    return _worker_engine.validate_team(team, gen)
+
+
+def add_arguments(parser):
+    parser.add_argument("pokedex", help="pokedex file (json, ndjson or normalized)")
+    parser.add_argument("teams", help="text file with one or more Showdown team exports")
+    parser.add_argument("--items", help="items.json or item index to also check held items")
+    parser.add_argument("--gen", type=int, choices=range(1, MAX_GENERATION + 1), default=MAX_GENERATION, help="generation to validate against")
+    parser.add_argument("--workers", type=int, default=0, help="validate in this many processes")
+
+
+def run(args):
+    engine = LegalityEngine.load(args.pokedex, args.items)
+    with open(args.teams, encoding="utf-8") as f:
+        teams = split_teams(f.read())
+
+    results = engine.validate_teams(teams, args.gen, args.workers)
+    illegal = 0
+    for number, problems in enumerate(results, 1):
+        if problems:
+            illegal += 1
+            print(f"Team {number}:")
+            for problem in problems:
+                print(f"  {problem}")
+    print(f"{len(teams) - illegal}/{len(teams)} teams legal")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate Showdown teams against an extracted pokedex")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
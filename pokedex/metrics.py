@@ -0,0 +1,184 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+
+# Upper bounds, in seconds, of the latency and timing histogram buckets.
+SECONDS_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PREFIX = "pokedex_"
+
+
+def _label_key(labels):
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _label_text(label_key):
+    # ("host", "pokemondb.net"), ("status", "200") -> "host=pokemondb.net,status=200"
+    return ",".join(f"{key}={value}" for key, value in label_key)
+
+
+def _prometheus_labels(label_key, extra=()):
+    pairs = [*label_key, *extra]
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+
+
+class Histogram:
+    # Fixed buckets plus count, sum, min and max.
+    def __init__(self, buckets=SECONDS_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value):
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def quantile(self, q):
+        # Upper bound of the bucket holding the q-th observation (max for the overflow bucket).
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+        }
+
+
+####################
+##    METRICS     ##
+####################
+class Metrics:
+    # Process-wide counters, gauges and histograms, keyed by name and labels.
+    #
+    # Fetches run in worker threads, so every update takes the lock. Gauges keep
+    # their current value and the highest value seen, which is what a queue
+    # depth or an in-flight count is read for after a run. summary() is the JSON
+    # form (with per-second rates of every counter over the run) and
+    # prometheus() the text exposition format.
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.monotonic()
+            self.counters = {}
+            self.gauges = {}
+            self.histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def set(self, name, value, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            _, peak = self.gauges.get(key, (value, value))
+            self.gauges[key] = (value, max(peak, value))
+
+    def add(self, name, delta, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            value, peak = self.gauges.get(key, (0, 0))
+            self.gauges[key] = (value + delta, max(peak, value + delta))
+
+    def observe(self, name, value, buckets=SECONDS_BUCKETS, **labels):
+        key = (name, _label_key(labels))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def summary(self):
+        with self.lock:
+            elapsed = time.monotonic() - self.started
+            result = {"elapsed_seconds": elapsed, "counters": {}, "rates": {}, "gauges": {}, "histograms": {}}
+            for (name, labels), value in sorted(self.counters.items()):
+                result["counters"].setdefault(name, {})[_label_text(labels)] = value
+                result["rates"][name + "_per_second"] = result["rates"].get(name + "_per_second", 0) + value / elapsed
+            for (name, labels), (value, peak) in sorted(self.gauges.items()):
+                result["gauges"].setdefault(name, {})[_label_text(labels)] = {"value": value, "max": peak}
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                result["histograms"].setdefault(name, {})[_label_text(labels)] = histogram.summary()
+        return result
+
+    def prometheus(self):
+        lines = []
+        with self.lock:
+            # Each gauge is exported twice: its current value and name_max, the peak.
+            families = {}
+            for (name, labels), value in sorted(self.counters.items()):
+                families.setdefault((name, "counter"), []).append((labels, value))
+            for (name, labels), (value, peak) in sorted(self.gauges.items()):
+                families.setdefault((name, "gauge"), []).append((labels, value))
+                families.setdefault((name + "_max", "gauge"), []).append((labels, peak))
+            for (name, kind), series in families.items():
+                lines.append(f"# TYPE {PREFIX}{name} {kind}")
+                lines.extend(f"{PREFIX}{name}{_prometheus_labels(labels)} {value}" for labels, value in series)
+            declared = set()
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                if name not in declared:
+                    lines.append(f"# TYPE {PREFIX}{name} histogram")
+                    declared.add(name)
+                cumulative = 0
+                for bound, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                    cumulative += count
+                    lines.append(f"{PREFIX}{name}_bucket{_prometheus_labels(labels, [('le', bound)])} {cumulative}")
+                lines.append(f"{PREFIX}{name}_sum{_prometheus_labels(labels)} {histogram.sum}")
+                lines.append(f"{PREFIX}{name}_count{_prometheus_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def write(self, json_path=None, prometheus_path=None):
+        if json_path:
+            with open(json_path, "w") as f:
+                json.dump(self.summary(), f, indent=4)
+        if prometheus_path:
+            with open(prometheus_path, "w") as f:
+                f.write(self.prometheus())
+
+
+# The one registry every module reports to.
+METRICS = Metrics()
+
+
+def add_metrics_arguments(parser):
+    parser.add_argument("--metrics", metavar="PATH", help="write a JSON summary of request, cache, parse and write metrics at the end of the run")
+    parser.add_argument("--metrics-prometheus", metavar="PATH", help="also write the metrics in the Prometheus text format")
@@ -0,0 +1,32 @@
+import argparse
+
+from .movecatalog import load_pokedex
+from .writer import open_writer
+
+def minify_json(input_filename, output_filename):
+    # Read the pokedex (json, ndjson or normalized)
+    data = load_pokedex(input_filename)
+
+    # Write the JSON file back out with no extra whitespace
+    with open_writer(output_filename, "minified") as writer:
+        for entry in data:
+            writer.write(entry)
+
+
+def add_arguments(parser):
+    parser.add_argument("input", nargs="?", default="pokedex.json")
+    parser.add_argument("output", nargs="?", default="minified_pokedex.json")
+
+
+def run(args):
+    minify_json(args.input, args.output)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a copy of a pokedex file without whitespace")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import argparse
+import json
+
+from .aliases import toid
+
+
+CATALOG_FIELDS = ("move", "type", "power", "accuracy")
+FORMAT_NAME = "pokedex-normalized-v1"
+
+
+def move_id(name):
+    # Showdown-style id: "Tera Blast" -> "terablast", "U-turn" -> "uturn"
+    return toid(name)
+
+
+####################
+##  MOVE CATALOG  ##
+####################
+class MoveCatalog:
+    # Shared {move id: {move, type, power, accuracy}} table for a normalized dex.
+    #
+    # A learnset entry keeps only its learn data (level, generations). Move pages
+    # for older generations can show older power/accuracy values, so when an
+    # entry's copy differs from the catalog the differing fields are kept on
+    # the entry as overrides. Expanding always gives back the original move data.
+    def __init__(self, moves=None):
+        self.moves = moves if moves is not None else {}
+
+    def _reference(self, move_data):
+        mid = move_id(move_data["move"])
+        catalog_entry = self.moves.setdefault(mid, {field: move_data.get(field) for field in CATALOG_FIELDS})
+        reference = {key: value for key, value in move_data.items() if key not in CATALOG_FIELDS}
+        for field in CATALOG_FIELDS:
+            if move_data.get(field) != catalog_entry[field]:
+                reference[field] = move_data.get(field)
+        return mid, reference
+
+    def _expand(self, mid, reference):
+        move_data = {"level": reference.get("level")}
+        move_data.update(self.moves[mid])
+        move_data.update(reference)
+        return move_data
+
+    def normalize(self, entry):
+        moves = entry.get("moves")
+        if isinstance(moves, dict):
+            learnset = {}
+            for move_data in moves.values():
+                mid, reference = self._reference(move_data)
+                learnset[mid] = reference
+        elif isinstance(moves, list):
+            learnset = []
+            for move_data in moves:
+                mid, reference = self._reference(move_data)
+                learnset.append({"id": mid, **reference})
+        else:
+            return entry
+        return dict(entry, moves=learnset)
+
+    def expand(self, entry):
+        learnset = entry.get("moves")
+        if isinstance(learnset, dict):
+            moves = {}
+            for mid, reference in learnset.items():
+                move_data = self._expand(mid, reference)
+                moves[move_data["move"]] = move_data
+        elif isinstance(learnset, list):
+            moves = [self._expand(reference["id"], {k: v for k, v in reference.items() if k != "id"}) for reference in learnset]
+        else:
+            return entry
+        return dict(entry, moves=moves)
+
+
+class NormalizedWriter:
+    # Streams {"format": ..., "pokemon": [...], "moves": {...}}; the move table is written last,
+    # once every entry has been seen.
+    def __init__(self, f):
+        self.f = f
+        self.catalog = MoveCatalog()
+        self.count = 0
+
+    def write(self, entry):
+        prefix = "," if self.count else '{"format":"%s","pokemon":[' % FORMAT_NAME
+        self.f.write(prefix + json.dumps(self.catalog.normalize(entry), separators=(',', ':')))
+        self.count += 1
+
+    def close(self):
+        if not self.count:
+            self.f.write('{"format":"%s","pokemon":[' % FORMAT_NAME)
+        self.f.write('],"moves":' + json.dumps(self.catalog.moves, separators=(',', ':')) + '}')
+
+
+####################
+##    LOADING     ##
+####################
+def load_pokedex(path):
+    # Loads a JSON array, an NDJSON file or a normalized file, always returning
+    # entries in the original (expanded) shape.
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    try:
+        data = json.loads(text)
+    except ValueError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    if isinstance(data, dict) and data.get("format") == FORMAT_NAME:
+        catalog = MoveCatalog(data["moves"])
+        return [catalog.expand(entry) for entry in data["pokemon"]]
+    if isinstance(data, dict):
+        # A single-entry NDJSON file parses as one object.
+        return [data]
+    return data
+
+
+def add_arguments(parser):
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--expand", action="store_true", help="write the original shape (indent=4) instead of the normalized one")
+
+
+def run(args):
+    entries = load_pokedex(args.input)
+    with open(args.output, "w") as f:
+        if args.expand:
+            json.dump(entries, f, indent=4)
+        else:
+            writer = NormalizedWriter(f)
+            for entry in entries:
+                writer.write(entry)
+            writer.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert a pokedex file to or from the normalized move-catalog format")
+    add_arguments(parser)
+    run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    main()
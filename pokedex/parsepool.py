@@ -0,0 +1,57 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+
+from .metrics import METRICS
+
+
+####################
+##  PARSE POOL    ##
+####################
+class ParsePool:
+    # Hands raw HTML from the fetch coroutines to parser processes.
+    #
+    # Jobs wait in a bounded queue and one consumer per worker keeps a job
+    # running in each process. When parsing falls behind, submit() blocks on the
+    # full queue, which in turn stops new pages from being fetched. Parse
+    # functions must be module-level and return plain data so that jobs and
+    # results pickle cheaply. With workers=0 parsing runs inline on the event loop.
+    # parser_options holds the (backend, partial) arguments passed on to the parse functions.
+    def __init__(self, workers, queue_size=None, parser_options=(None, True)):
+        self.workers = workers
+        self.parser_options = parser_options
+        self.queue = asyncio.Queue(queue_size or max(2 * workers, 1))
+        self.executor = ProcessPoolExecutor(workers) if workers else None
+        self.consumers = [asyncio.ensure_future(self._consume()) for _ in range(max(workers, 1))]
+
+    async def submit(self, func, *args):
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((func, args, future))
+        METRICS.set("parse_queue_depth", self.queue.qsize())
+        return await future
+
+    async def _consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            func, args, future = await self.queue.get()
+            try:
+                # Parse time per page type, including the trip to and from the worker process.
+                with METRICS.timer("parse_seconds", page=func.__name__):
+                    if self.executor:
+                        result = await loop.run_in_executor(self.executor, func, *args)
+                    else:
+                        result = func(*args)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            else:
+                if not future.done():
+                    future.set_result(result)
+            finally:
+                self.queue.task_done()
+
+    async def close(self):
+        for consumer in self.consumers:
+            consumer.cancel()
+        await asyncio.gather(*self.consumers, return_exceptions=True)
+        if self.executor:
+            self.executor.shutdown()
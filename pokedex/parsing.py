@@ -0,0 +1,249 @@
+import re
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+
+
+####################
+##   BACKENDS     ##
+####################
+def available_backends():
+    backends = []
+    for backend in ("lxml", "html.parser", "html5lib"):
+        try:
+            BeautifulSoup("<p></p>", backend)
+        except FeatureNotFound:
+            continue
+        backends.append(backend)
+    return backends
+
+
+DEFAULT_BACKEND = "lxml" if "lxml" in available_backends() else "html.parser"
+
+# The only regions of each page type the extractors read. A partial parse
+# builds these subtrees and skips the rest of the page.
+PAGE_REGIONS = {
+    # Vitals and breeding tables, the per-form ability tabs and the evolution chart.
+    "species": SoupStrainer(attrs={"class": ["vitals-table", "sv-tabs-tab", "sv-tabs-panel", "infocard-list-evo"]}),
+    # The same, plus the move tables printed on the species page itself.
+    "species_with_moves": SoupStrainer(attrs={"class": ["vitals-table", "sv-tabs-tab", "sv-tabs-panel", "infocard-list-evo", "data-table"]}),
+    "moves": SoupStrainer("table", attrs={"class": "data-table"}),
+    "index": SoupStrainer("table", id="pokedex"),
+}
+
+
+def make_soup(html, page=None, backend=None, partial=True):
+    # html5lib ignores parse_only, so it always builds the full tree.
+    parse_only = PAGE_REGIONS[page] if page and partial and backend != "html5lib" else None
+    return BeautifulSoup(html, backend or DEFAULT_BACKEND, parse_only=parse_only)
+
+
+def add_parser_arguments(parser):
+    parser.add_argument("--parser", choices=available_backends(), default=DEFAULT_BACKEND, help="HTML parsing backend")
+    parser.add_argument("--full-parse", action="store_true", help="build the whole page tree instead of only the regions that are read")
+
+
+####################
+##  GET GENDER    ##
+####################
+def get_gender(soup):
+    breeding_section = soup.find("h2", string="Breeding")
+
+    if not breeding_section:
+        return ["Genderless"]
+
+    table = breeding_section.find_next("table", class_="vitals-table")
+
+    if not table:
+        return ["Genderless"]
+
+    gender_row = table.find("th", string="Gender")
+
+    if not gender_row:
+        return ["Genderless"]
+
+    gender_info = gender_row.find_next_sibling("td")
+
+    if not gender_info:
+        return ["Genderless"]
+
+    gender_text = gender_info.get_text(strip=True)
+
+    if "Genderless" in gender_text:
+        return ["Genderless"]
+
+    genders = []
+
+    if "male" in gender_text.lower():
+        genders.append("Male")
+    if "female" in gender_text.lower():
+        genders.append("Female")
+
+    return genders
+
+####################
+##  Get EVOLUTION ##
+####################
+def get_evolutions(soup):
+    evolutions = {}
+    infocard_list_evo = soup.find("div", class_="infocard-list-evo")
+    if infocard_list_evo:
+        infocard_arrows = infocard_list_evo.find_all("span", class_="infocard-arrow")
+        for arrow in infocard_arrows:
+            level_text = arrow.find("small").text
+            level = int(re.search(r'\d+', level_text).group()) if re.search(r'\d+', level_text) else None
+            next_pokemon = arrow.find_next("span", class_="infocard-lg-data").find("a", class_="ent-name").text
+            evolutions[next_pokemon] = level
+    return evolutions
+
+
+def _is_card(tag):
+    classes = tag.get("class") or []
+    return tag.name == "div" and "infocard" in classes
+
+
+def _card_name(card):
+    return card.find("span", class_="infocard-lg-data").find("a", class_="ent-name").text
+
+
+def get_evolution_edges(soup):
+    # [from, to, level] for every arrow in the evolution charts. The source is
+    # the card before the arrow in its own list; the first arrow of a branch
+    # ("infocard-evo-split") takes the card before the split instead.
+    edges = []
+    for arrow in soup.find_all("span", class_="infocard-arrow"):
+        source = arrow.find_previous_sibling(_is_card)
+        split = arrow.find_parent("span", class_="infocard-evo-split")
+        while source is None and split is not None:
+            source = split.find_previous_sibling(_is_card)
+            split = split.find_parent("span", class_="infocard-evo-split")
+        target = arrow.find_next_sibling(_is_card)
+        if source is None or target is None:
+            continue
+        level_text = arrow.find("small").text
+        level = int(re.search(r'\d+', level_text).group()) if re.search(r'\d+', level_text) else None
+        edges.append([_card_name(source), _card_name(target), level])
+    return edges
+
+####################
+##  GET VITALS    ##
+####################
+def get_vitals(soup):
+    # The first vitals table ("Pokédex data") as a dict, or None when the page has none.
+    table = soup.find("table", class_="vitals-table")
+    if not table:
+        return None
+
+    rows = table.find_all("tr")
+    return {
+        "species": rows[2].find("td").text,
+        "height": rows[3].find("td").text,
+        "weight": rows[4].find("td").text,
+        "abilities": [a.text for a in rows[5].find("td").find_all("a")],
+        "local_no": rows[6].find("td").text.strip(),
+    }
+
+
+def get_form_abilities(soup):
+    # Abilities of every form, from the "#tab-basic-*" tabs, keyed by tab label.
+    tab_links = soup.find_all("a", class_="sv-tabs-tab")
+    form_links = [link for link in tab_links if link.get("href").startswith("#tab-basic-")]
+    abilities_map = {}
+
+    for form_link in form_links:
+        form_id = form_link["href"].replace("#tab-basic-", "")
+        form_name = form_link.text
+        form_tab = soup.find("div", id=f"tab-basic-{form_id}")
+        abilities_row = form_tab.find("th", string="Abilities").find_next_sibling("td")
+        abilities = [a.text for a in abilities_row.find_all("a")]
+        abilities_map[form_name] = abilities
+
+    return abilities_map
+
+##########################
+## GET MOVES FROM TABLE ##
+##########################
+def get_move_rows(moves_table):
+    # Yields (level, move, type, power, accuracy) for every row naming a move.
+    # level is the stripped cell text, or None when the table has no level column.
+    move_rows = moves_table.find_all("tr")[1:]
+    header_row = moves_table.find("tr")
+    headers = header_row.find_all("th")
+
+    level_column_index = None
+    for i, header in enumerate(headers):
+        header_text = header.find("div", class_="sortwrap")
+        if header_text and "lv." in header_text.text.lower():
+            level_column_index = i
+            break
+
+    for row in move_rows:
+        cells = row.find_all("td")
+
+        move_link = None
+        move_type_element = None
+
+        for cell in cells:
+            if not move_link:
+                move_link = cell.find("a", class_="ent-name")
+            if not move_type_element:
+                move_type_element = cell.find("a", class_="type-icon")
+            if move_link and move_type_element:
+                break
+
+        if move_link and move_type_element:
+            level = cells[level_column_index].text.strip() if level_column_index is not None else None
+
+            power_cell = cells[-2].text
+            power = int(power_cell) if power_cell.isdigit() else None
+
+            accuracy_cell = cells[-1].text
+            accuracy = int(accuracy_cell) if accuracy_cell.isdigit() else None
+
+            yield level, move_link.text, move_type_element.text, power, accuracy
+
+####################
+##  GET POKEDEX   ##
+####################
+def get_pokemon_list(html, backend=None, partial=True):
+    soup = make_soup(html, "index", backend, partial)
+
+    pokemon_list = []
+
+    table = soup.find("table", {"id": "pokedex"})
+    rows = table.find_all("tr")
+
+    for row in rows[1:]:
+        cells = row.find_all("td")
+        image_url = cells[0].find("img")["src"]
+        dex_number = int(cells[0].find("span", class_="infocard-cell-data").text)
+        name_element = cells[1].find("a", class_="ent-name")
+        name = name_element.text
+        form_name_element = cells[1].find("small", class_="text-muted")
+        if form_name_element:
+            form_name = form_name_element.text
+            name += f" ({form_name})"
+        types = [typ.text for typ in cells[2].find_all("a")]
+        total = int(cells[3].text)
+        hp = int(cells[4].text)
+        attack = int(cells[5].text)
+        defense = int(cells[6].text)
+        sp_atk = int(cells[7].text)
+        sp_def = int(cells[8].text)
+        speed = int(cells[9].text)
+
+        pokemon = {
+            "image": image_url,
+            "dex_number": dex_number,
+            "name": name,
+            "type": types,
+            "total": total,
+            "hp": hp,
+            "attack": attack,
+            "defense": defense,
+            "sp_atk": sp_atk,
+            "sp_def": sp_def,
+            "speed": speed,
+        }
+
+        pokemon_list.append(pokemon)
+
+    return pokemon_list
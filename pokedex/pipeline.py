@@ -0,0 +1,100 @@
+from contextlib import ExitStack
+
+from .delta import DeltaBase
+from .metrics import METRICS
+from .writer import FORMATS, open_writer
+
+
+####################
+##    STAGES      ##
+####################
+def fix_abilities(entry):
+    # hotfix.py's reshaping as a per-entry stage: keep only the abilities of
+    # the entry's own form (the form_name tab is renamed to the entry name
+    # first) and turn the {form: abilities} map into that list. Returns a new
+    # entry; forms that share an abilities map are left untouched.
+    abilities = entry.get("abilities")
+    if not isinstance(abilities, dict):
+        return entry
+    abilities = dict(abilities)
+    name = entry["name"]
+
+    # Rename form_name in abilities to name
+    if "form_name" in entry and entry["form_name"] in abilities:
+        abilities[name] = abilities[entry["form_name"]]
+        del abilities[entry["form_name"]]
+
+    # Delete abilities that do not match the 'name' key
+    abilities = {key: value for key, value in abilities.items() if key == name}
+
+    # Convert "abilities" dictionary to a list
+    return dict(entry, abilities=abilities.get(name, abilities))
+
+
+####################
+##    PIPELINE    ##
+####################
+class open_pipeline:
+    # Runs every entry through the stages once and writes the result to every
+    # output, so all outputs come from a single pass:
+    #
+    #   with open_pipeline([("pokedex.json", "json"), ("minified_pokedex.json", "minified")], [fix_abilities]) as pipeline:
+    #       pipeline.write(entry)
+    #
+    # A stage takes an entry and returns the entry to write, or None to drop it.
+    # A "delta" output is computed against delta_base, the previous build.
+    def __init__(self, outputs, stages=(), delta_base=None):
+        self.outputs = outputs
+        self.stages = list(stages)
+        self.delta_base = delta_base
+
+    def __enter__(self):
+        self.stack = ExitStack()
+        try:
+            self.writers = [self.stack.enter_context(open_writer(path, format, base=self.delta_base)) for path, format in self.outputs]
+        except BaseException:
+            self.stack.close()
+            raise
+        return self
+
+    def write(self, entry):
+        for stage in self.stages:
+            entry = stage(entry)
+            if entry is None:
+                return
+        for (_, format), writer in zip(self.outputs, self.writers):
+            with METRICS.timer("write_seconds", format=format):
+                writer.write(entry)
+        METRICS.inc("entries_written_total")
+
+    def __exit__(self, exc_type, exc, tb):
+        return self.stack.__exit__(exc_type, exc, tb)
+
+
+def add_output_arguments(parser, stem="pokemon_data"):
+    parser.add_argument("--format", choices=FORMATS, default="json", help="json writes one array, minified the same without whitespace, ndjson one entry per line, normalized a shared move table plus per-entry move ids")
+    parser.add_argument("--output", help=f"output file (default: {stem}.json, or {stem}.ndjson)")
+    parser.add_argument("--also", action="append", default=[], metavar="FORMAT:PATH", help="write another output in the same pass, e.g. minified:minified_pokedex.json (repeatable)")
+    parser.add_argument("--fix-abilities", action="store_true", help="reshape abilities like hotfix.py while writing")
+    parser.add_argument("--delta", metavar="PATH", help="also write the changes since the previous build (upserts and deletes by name)")
+    parser.add_argument("--delta-base", metavar="PATH", help="previous build to compare against (default: the existing --output file)")
+
+
+def output_path(args, stem="pokemon_data"):
+    return args.output or (f"{stem}.ndjson" if args.format == "ndjson" else f"{stem}.json")
+
+
+def pipeline_from_args(args, stem="pokemon_data"):
+    outputs = [(output_path(args, stem), args.format)]
+    for spec in args.also:
+        format, _, path = spec.partition(":")
+        if format not in FORMATS or not path:
+            raise ValueError(f"--also expects FORMAT:PATH with FORMAT one of {', '.join(FORMATS)}, got {spec!r}")
+        outputs.append((path, format))
+    stages = [fix_abilities] if args.fix_abilities else []
+    delta_base = None
+    if args.delta:
+        # Read before the outputs are opened, since the base is usually the file about to be overwritten.
+        delta_base = DeltaBase.load(args.delta_base or outputs[0][0])
+        outputs.append((args.delta, "delta"))
+    return open_pipeline(outputs, stages, delta_base)
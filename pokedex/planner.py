@@ -0,0 +1,95 @@
+import re
+
+from .metrics import METRICS
+
+
+# Highest National Pokédex number introduced in each generation.
+NATIONAL_DEX_ENDS = (151, 251, 386, 493, 649, 721, 809, 905, 1025)
+
+# Generation of every game pokemondb.net lists in the Local № row, by the name
+# in parentheses (a " — Central Kalos" style suffix is dropped first).
+GAME_GENERATIONS = {
+    "Red/Blue/Yellow": 1,
+    "Gold/Silver/Crystal": 2,
+    "Ruby/Sapphire/Emerald": 3,
+    "FireRed/LeafGreen": 3,
+    "Diamond/Pearl": 4,
+    "Platinum": 4,
+    "HeartGold/SoulSilver": 4,
+    "Black/White": 5,
+    "Black 2/White 2": 5,
+    "X/Y": 6,
+    "Omega Ruby/Alpha Sapphire": 6,
+    "Sun/Moon": 7,
+    "U.Sun/U.Moon": 7,
+    "Let's Go Pikachu/Let's Go Eevee": 7,
+    "Sword/Shield": 8,
+    "The Isle of Armor": 8,
+    "The Crown Tundra": 8,
+    "Brilliant Diamond/Shining Pearl": 8,
+    "Legends: Arceus": 8,
+    "Scarlet/Violet": 9,
+    "The Teal Mask": 9,
+    "The Indigo Disk": 9,
+    "Legends: Z-A": 9,
+}
+
+
+def national_generation(dex_number):
+    # Generation a National Pokédex number was introduced in, or None past the table.
+    for gen, last in enumerate(NATIONAL_DEX_ENDS, start=1):
+        if dex_number <= last:
+            return gen
+    return None
+
+
+def listed_generations(local_no):
+    # "0001 (Red/Blue/Yellow)0231 (X/Y — Central Kalos)" -> {1, 6}; unknown games are ignored.
+    games = (game.split(" — ")[0].strip() for game in re.findall(r"\(([^)]*)\)", local_no or ""))
+    return {GAME_GENERATIONS[game] for game in games if game in GAME_GENERATIONS}
+
+
+def introduction_generation(dex_number, local_no):
+    # The earliest generation the species can have a move page in: its National
+    # № generation, or an earlier game listing it (there should be none). A
+    # species newer than NATIONAL_DEX_ENDS falls back on its listings alone.
+    candidates = listed_generations(local_no)
+    if dex_number is not None and national_generation(dex_number) is not None:
+        candidates.add(national_generation(dex_number))
+    return min(candidates, default=1)
+
+
+####################
+##  FETCH PLAN    ##
+####################
+class FetchPlan:
+    # Which /moves/{gen} pages to request for each species.
+    #
+    # pokemondb.net has no move page for a generation before the species was
+    # introduced, so those requests can only come back 404. The plan drops them
+    # using the National № and the Local № row of the species page, which is
+    # fetched first anyway. Later generations are all kept: a species missing
+    # from a game's regional dexes can still be in the game (transfers, the
+    # post-game National Dex), so the listings are not proof of a missing page.
+    def __init__(self, generations, enabled=True):
+        self.generations = list(generations)
+        self.enabled = enabled
+        self.planned = 0
+        self.skipped = 0
+
+    def generations_for(self, dex_number, local_no):
+        if self.enabled:
+            first = introduction_generation(dex_number, local_no)
+            generations = [gen for gen in self.generations if gen >= first]
+        else:
+            generations = self.generations
+        skipped = len(self.generations) - len(generations)
+        self.planned += len(generations)
+        self.skipped += skipped
+        METRICS.inc("move_pages_planned_total", len(generations))
+        METRICS.inc("requests_avoided_total", skipped)
+        return generations
+
+    def report(self):
+        total = self.planned + self.skipped
+        return f"Requested {self.planned} of {total} move pages; skipped {self.skipped} that cannot exist."
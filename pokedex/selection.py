@@ -0,0 +1,23 @@
+import argparse
+
+
+def parse_range(text):
+    # "1-151", "25", "152-" or "-9" -> inclusive (low, high), None for an open end.
+    low, separator, high = text.partition("-")
+    try:
+        low = int(low) if low.strip() else None
+        high = (int(high) if high.strip() else None) if separator else low
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected a number or a range like 1-151, got {text!r}")
+    if low is not None and high is not None and low > high:
+        raise argparse.ArgumentTypeError(f"empty range {text!r}")
+    return low, high
+
+
+def in_range(value, bounds):
+    low, high = bounds or (None, None)
+    return (low is None or value >= low) and (high is None or value <= high)
+
+
+def add_dex_argument(parser):
+    parser.add_argument("--dex", type=parse_range, default=(None, None), metavar="RANGE", help="only these national dex numbers, e.g. 1-151 or 906-")
@@ -0,0 +1,144 @@
+import hashlib
+import json
+import threading
+import zipfile
+from urllib.parse import urlsplit
+
+import requests
+
+
+class FetchError(Exception):
+    pass
+
+
+####################
+##   RESPONSE     ##
+####################
+class Response:
+    # Detached copy of an HTTP response, safe to hand between threads.
+    def __init__(self, url, status_code, content, headers=None, encoding=None):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding, errors="replace")
+
+    def raise_for_status(self):
+        # Error pages must not be parsed as if they were the page asked for.
+        if self.status_code >= 400:
+            raise FetchError(f"HTTP {self.status_code} for {self.url}")
+
+
+def rebase_url(url, base_url):
+    # https://host/path -> {base_url}/host/path, for serving a mirror of every
+    # host from one local server (a stub or python -m http.server).
+    parts = urlsplit(url)
+    query = f"?{parts.query}" if parts.query else ""
+    return f"{base_url.rstrip('/')}/{parts.netloc}{parts.path}{query}"
+
+
+# A transport turns (url, request headers) into a Response. The Fetcher layers
+# the cache and retries on top, so a transport only ever makes one attempt.
+
+####################
+##  HTTP          ##
+####################
+class HttpTransport:
+    # The network, through one pooled requests.Session.
+    def __init__(self, pool_size=10, base_url=None, timeout=30):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def send(self, url, headers=None):
+        response = self.session.get(rebase_url(url, self.base_url) if self.base_url else url, headers=headers or {}, timeout=self.timeout)
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        return Response(url, response.status_code, response.content, headers, response.encoding)
+
+    def close(self):
+        self.session.close()
+
+
+####################
+##  RECORD/REPLAY ##
+####################
+# Archive layout (one zip, deflate-compressed):
+#
+#   objects/<sha256 of body>   every distinct body once
+#   index.json                 {url: {"status", "headers", "encoding", "body"}}
+ARCHIVE_INDEX = "index.json"
+# Throttling and server errors, which the Fetcher retries.
+TRANSIENT_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RecordingTransport:
+    # Passes requests to another transport and saves the last response for
+    # every url.
+    #
+    # Each attempt replaces the previous one in the index, so a retried url
+    # keeps the answer that ended the retries, whatever its status: a 429 or
+    # 503 that outlasted them replays as that status, not as a ReplayMiss.
+    # Conditional headers are dropped, so the site always sends the full page
+    # and a replay never needs the HTTP cache. Bodies are written as they
+    # arrive; the index is written at close().
+    def __init__(self, transport, path):
+        self.transport = transport
+        self.path = path
+        self.archive = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self.index = {}
+        self.lock = threading.Lock()
+
+    def send(self, url, headers=None):
+        response = self.transport.send(url)
+        digest = hashlib.sha256(response.content).hexdigest()
+        with self.lock:
+            if f"objects/{digest}" not in self.archive.NameToInfo:
+                self.archive.writestr(f"objects/{digest}", response.content)
+            self.index[url] = {"status": response.status_code, "headers": response.headers, "encoding": response.encoding, "body": digest}
+        return response
+
+    def close(self):
+        self.transport.close()
+        with self.lock:
+            self.archive.writestr(ARCHIVE_INDEX, json.dumps(self.index, sort_keys=True, indent=1))
+            self.archive.close()
+
+
+class ReplayMiss(FetchError):
+    pass
+
+
+class ReplayTransport:
+    # Serves every request from a recorded archive and never touches the network.
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path)
+        self.index = json.loads(self.archive.read(ARCHIVE_INDEX))
+        self.lock = threading.Lock()
+
+    def send(self, url, headers=None):
+        record = self.index.get(url)
+        if record is None:
+            raise ReplayMiss(f"Not in the recording: {url}")
+        with self.lock:
+            content = self.archive.read(f"objects/{record['body']}")
+        return Response(url, record["status"], content, dict(record["headers"]), record["encoding"])
+
+    def close(self):
+        self.archive.close()
+
+
+def read_archive(path):
+    # Every response in a --record archive, by url.
+    transport = ReplayTransport(path)
+    try:
+        for url in sorted(transport.index):
+            yield transport.send(url)
+    finally:
+        transport.close()
@@ -0,0 +1,96 @@
+import json
+
+from .delta import DeltaWriter
+from .movecatalog import NormalizedWriter
+
+
+####################
+##  JSON ARRAY    ##
+####################
+class JsonArrayWriter:
+    # Writes a JSON array one entry at a time. The finished file is identical to
+    # json.dump(entries, f, indent=indent), or to the separators=(',', ':') form
+    # when indent is None.
+    def __init__(self, f, indent=4):
+        self.f = f
+        self.indent = indent
+        self.count = 0
+
+    def write(self, entry):
+        if self.indent is None:
+            text = json.dumps(entry, separators=(',', ':'))
+            self.f.write(("," if self.count else "[") + text)
+        else:
+            pad = " " * self.indent
+            text = json.dumps(entry, indent=self.indent)
+            self.f.write((",\n" if self.count else "[\n") + pad + text.replace("\n", "\n" + pad))
+        self.count += 1
+
+    def close(self):
+        if not self.count:
+            self.f.write("[]")
+        elif self.indent is None:
+            self.f.write("]")
+        else:
+            self.f.write("\n]")
+
+
+####################
+##    NDJSON      ##
+####################
+class NdjsonWriter:
+    # One compact JSON document per line; readers can consume the file while it is still being written.
+    def __init__(self, f):
+        self.f = f
+        self.count = 0
+
+    def write(self, entry):
+        self.f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.f.flush()
+        self.count += 1
+
+    def close(self):
+        pass
+
+
+FORMATS = ("json", "minified", "ndjson", "normalized")
+
+
+class open_writer:
+    # with open_writer("pokemon_data.json", "json") as writer: writer.write(entry)
+    #
+    # The "delta" format also needs base, the delta.DeltaBase of the previous build.
+    def __init__(self, path, format="json", indent=4, base=None):
+        if format not in FORMATS and format != "delta":
+            raise ValueError(f"Unknown output format: {format}")
+        if format == "delta" and base is None:
+            raise ValueError("The delta format needs the previous build as its base")
+        self.path = path
+        self.format = format
+        self.indent = indent
+        self.base = base
+
+    def __enter__(self):
+        if self.format == "ndjson":
+            self.file = open(self.path, "w", encoding="utf-8")
+            self.writer = NdjsonWriter(self.file)
+        elif self.format == "normalized":
+            self.file = open(self.path, "w")
+            self.writer = NormalizedWriter(self.file)
+        elif self.format == "delta":
+            self.file = open(self.path, "w", encoding="utf-8")
+            self.writer = DeltaWriter(self.file, self.base)
+        elif self.format == "minified":
+            self.file = open(self.path, "w")
+            self.writer = JsonArrayWriter(self.file, indent=None)
+        else:
+            self.file = open(self.path, "w")
+            self.writer = JsonArrayWriter(self.file, indent=self.indent)
+        return self.writer
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.writer.close()
+        finally:
+            self.file.close()
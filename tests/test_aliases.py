@@ -0,0 +1,58 @@
+import pytest
+
+from pokedex.aliases import AliasIndex, apply_canonical_name, canonical_name, toid
+from pokedex.pipeline import fix_abilities
+
+
+def test_toid():
+    assert toid("Mr. Mime-Galar") == "mrmimegalar"
+    assert toid("Nidoran♀") == "nidoranf"
+    assert toid("Nidoran♂") == "nidoranm"
+    assert toid("Flabébé") == "flabebe"
+    assert toid("Farfetch'd") == "farfetchd"
+    assert toid("Tera Blast") == "terablast"
+    assert toid("U-turn") == "uturn"
+
+
+def test_canonical_names():
+    assert canonical_name("Nidoran♀") == "Nidoran-F"
+    assert canonical_name("Nidoran♂") == "Nidoran-M"
+    assert canonical_name("Rotom (Heat Rotom)") == "Rotom-Heat"
+    assert canonical_name("Bulbasaur") == "Bulbasaur"
+
+
+def test_nidoran_abilities_follow_the_rename():
+    entry = {"name": "Nidoran♂", "abilities": {"Nidoran♂": ["Poison Point", "Rivalry"]}}
+    apply_canonical_name(entry)
+    assert entry["name"] == "Nidoran-M"
+    assert entry["abilities"] == {"Nidoran-M": ["Poison Point", "Rivalry"]}
+    assert fix_abilities(entry)["abilities"] == ["Poison Point", "Rivalry"]
+
+
+def test_alias_index_resolves_display_names_labels_and_ids():
+    aliases = AliasIndex()
+    assert aliases["Rotom (Heat Rotom)"] == "Rotom-Heat"
+    assert aliases["heat rotom"] == "Rotom-Heat"
+    assert aliases["rotomheat"] == "Rotom-Heat"
+    assert aliases["Nidoran♀"] == "Nidoran-F"
+    assert aliases["nidoranm"] == "Nidoran-M"
+    assert aliases["Flabébé"] == "Flabebe"
+    assert aliases["Indeedee (Female)"] == "Indeedee-F"
+    # "Female" labels Indeedee, Meowstic and others, so it names nothing.
+    assert "Female" not in aliases
+    assert aliases.resolve("Missingno") is None
+    with pytest.raises(KeyError):
+        aliases["Missingno"]
+
+
+def test_alias_index_from_entries_only_knows_those_entries():
+    aliases = AliasIndex.from_entries([{"name": "Rotom"}, {"name": "Rotom-Wash"}])
+    assert aliases["wash rotom"] == "Rotom-Wash"
+    assert aliases["ROTOM"] == "Rotom"
+    assert "Heat Rotom" not in aliases
+
+
+def test_canonical_name_wins_over_alias():
+    aliases = AliasIndex(["Rotom-Heat", "Heat Rotom"])
+    assert aliases["heat rotom"] == "Heat Rotom"
+    assert aliases["Rotom (Heat Rotom)"] == "Rotom-Heat"
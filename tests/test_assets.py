@@ -0,0 +1,78 @@
+import functools
+import json
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from pokedex import assets
+
+Image = pytest.importorskip("PIL.Image")
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def site(tmp_path):
+    # A mirror of every host under one local server, as --base-url expects.
+    root = tmp_path / "site"
+    sprites = root / "img.pokemondb.net" / "sprites"
+    sprites.mkdir(parents=True)
+    Image.new("RGBA", (40, 30), "red").save(sprites / "bulbasaur.png")
+    Image.new("RGBA", (20, 50), "blue").save(sprites / "ivysaur.png")
+    # The same sprite under a second url.
+    (sprites / "bulbasaur-copy.png").write_bytes((sprites / "bulbasaur.png").read_bytes())
+    items = root / "archives.bulbagarden.net"
+    items.mkdir()
+    Image.new("RGBA", (24, 24), "green").save(items / "Bag_Leftovers_Sprite.png")
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), functools.partial(QuietHandler, directory=str(root)))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_mirror_and_atlas(tmp_path, site):
+    entries = [
+        {"name": "Bulbasaur", "image": "https://img.pokemondb.net/sprites/bulbasaur.png"},
+        {"name": "Bulbasaur-Copy", "image": "https://img.pokemondb.net/sprites/bulbasaur-copy.png"},
+        {"name": "Ivysaur", "image": "https://img.pokemondb.net/sprites/ivysaur.png"},
+        {"name": "Venusaur", "image": "https://img.pokemondb.net/sprites/venusaur.png"},
+    ]
+    items = {"Leftovers": {"Image": "//archives.bulbagarden.net/Bag_Leftovers_Sprite.png"}}
+    (tmp_path / "pokedex.json").write_text(json.dumps(entries))
+    (tmp_path / "items.json").write_text(json.dumps(items))
+    output = tmp_path / "assets"
+
+    assets.main([
+        str(tmp_path / "pokedex.json"), "--items", str(tmp_path / "items.json"), "--output-dir", str(output),
+        "--base-url", site, "--no-cache", "--retries", "0", "--rate", "0", "--atlas",
+    ])
+
+    manifest = json.loads((output / assets.MANIFEST).read_text())
+    files = manifest["files"]
+    # The missing sprite is recorded, and the rest are still mirrored.
+    assert manifest["failed"] == ["https://img.pokemondb.net/sprites/venusaur.png"]
+    assert len(files) == 4
+    assert files["https://img.pokemondb.net/sprites/bulbasaur.png"] == files["https://img.pokemondb.net/sprites/bulbasaur-copy.png"]
+    assert (output / files["https://archives.bulbagarden.net/Bag_Leftovers_Sprite.png"]).read_bytes() == (
+        tmp_path / "site" / "archives.bulbagarden.net" / "Bag_Leftovers_Sprite.png").read_bytes()
+
+    atlas = json.loads((output / assets.ATLAS_MAP).read_text())
+    assert atlas["sheets"] == {"pokemon": ["pokemon-0.png"], "items": ["items-0.png"]}
+    assert set(atlas["sprites"]) == set(files)
+    sheet, x, y, w, h = atlas["sprites"]["https://img.pokemondb.net/sprites/ivysaur.png"]
+    with Image.open(output / sheet) as image:
+        assert image.crop((x, y, x + w, y + h)).getpixel((0, 0)) == (0, 0, 255, 255)
+    assert atlas["sprites"]["https://archives.bulbagarden.net/Bag_Leftovers_Sprite.png"] == ["items-0.png", 0, 0, 24, 24]
+
+
+def test_pack_shelves_starts_a_new_shelf_when_full():
+    assert assets.pack_shelves([(60, 10), (60, 20), (30, 5)], 100) == [(0, 20), (0, 0), (60, 20)]
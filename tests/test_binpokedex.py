@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from pokedex.binpokedex import BinaryPokedex, write_binary
+
+
+def make_entry(dex_number, name, form_name=None, **fields):
+    # Keys in the order the extractor writes them.
+    entry = {
+        "image": f"https://img.pokemondb.net/artwork/{name.lower()}.jpg",
+        "dex_number": dex_number,
+        "name": name,
+        "type": ["Poison"],
+        "total": 275, "hp": 55, "attack": 47, "defense": 52, "sp_atk": 40, "sp_def": 40, "speed": 41,
+        **({"form_name": form_name} if form_name else {}),
+        "species": "Poison Pin Pokémon",
+        "height": "0.4 m",
+        "weight": "7.0 kg",
+        "abilities": ["Poison Point", "Rivalry", "Hustle"],
+        "local_no": "0029 (Red/Blue/Yellow)",
+        "moves": {
+            "Growl": {"level": 1, "move": "Growl", "type": "Normal", "power": None, "accuracy": 100, "generations": [1, 9]},
+            "Toxic": {"level": None, "move": "Toxic", "type": "Poison", "power": None, "accuracy": 90, "generations": [1, 2, 3]},
+        },
+        "gender": ["Female"],
+        "evolutions": [{"name": "Nidorina", "level": 16}],
+        "Evolves": 16,
+    }
+    entry.update(fields)
+    return entry
+
+
+ENTRIES = [
+    make_entry(29, "Nidoran♀"),
+    make_entry(32, "Nidoran♂", gender=["Male"], Evolves=None),
+    make_entry(479, "Rotom", type=["Electric", "Ghost"], gender=["Genderless"], moves={}),
+    make_entry(479, "Rotom-Heat", form_name="Heat Rotom", type=["Electric", "Fire"], gender=["Genderless"], moves={}),
+]
+del ENTRIES[2]["Evolves"]
+
+
+@pytest.fixture
+def binary(tmp_path):
+    with open(tmp_path / "pokedex.json", "w", encoding="utf-8") as f:
+        json.dump(ENTRIES, f, ensure_ascii=False, indent=4)
+    with open(tmp_path / "pokedex.json", encoding="utf-8") as f:
+        entries = json.load(f)
+    write_binary(entries, str(tmp_path / "pokedex.bin"))
+    with BinaryPokedex(str(tmp_path / "pokedex.bin")) as dex:
+        yield dex
+
+
+def test_entries_decode_to_the_json_entries(binary):
+    assert len(binary) == len(ENTRIES)
+    for i, entry in enumerate(ENTRIES):
+        decoded = binary.entry(i)
+        assert decoded == entry
+        assert list(decoded) == list(entry)
+
+
+def test_lookups(binary):
+    assert binary.get("nidoran♂") == ENTRIES[1]
+    assert binary.get("Missingno") is None
+    assert binary.by_dex_number(479) == ENTRIES[2:]
+    assert binary.by_dex_number(1) == []
+
+
+def test_list_shaped_moves_are_refused(tmp_path):
+    with pytest.raises(ValueError):
+        write_binary([make_entry(1, "Bulbasaur", moves=[])], str(tmp_path / "pokedex.bin"))
@@ -0,0 +1,58 @@
+import io
+import json
+
+import pytest
+
+from pokedex.delta import DeltaBase, DeltaWriter, apply_delta
+
+
+OLD = [
+    {"dex_number": 1, "name": "Bulbasaur", "moves": {"Tackle": {"level": 1}}},
+    {"dex_number": 2, "name": "Ivysaur", "moves": {}},
+    {"dex_number": 3, "name": "Venusaur", "moves": {}},
+    {"dex_number": 3, "name": "Venusaur", "form_name": "Mega Venusaur", "moves": {}},
+]
+
+
+def compute_delta(old, new):
+    f = io.StringIO()
+    writer = DeltaWriter(f, DeltaBase.from_entries(old))
+    for entry in new:
+        writer.write(entry)
+    writer.close()
+    return json.loads(f.getvalue())
+
+
+def test_added_removed_and_changed_entries_round_trip():
+    new = [
+        {"dex_number": 1, "name": "Bulbasaur", "moves": {"Tackle": {"level": 1}, "Growl": {"level": 3}}},
+        {"dex_number": 3, "name": "Venusaur", "moves": {}},
+        {"dex_number": 3, "name": "Venusaur", "form_name": "Mega Venusaur", "moves": {}},
+        {"dex_number": 4, "name": "Charmander", "moves": {}},
+    ]
+    delta = compute_delta(OLD, new)
+    assert [upsert["key"] for upsert in delta["upserts"]] == ["Bulbasaur", "Charmander"]
+    assert delta["deletes"] == ["Ivysaur"]
+    assert delta["order"] is None
+    assert apply_delta(OLD, delta) == new
+
+
+def test_reordered_entries_round_trip():
+    new = [OLD[1], OLD[0], OLD[2], OLD[3]]
+    delta = compute_delta(OLD, new)
+    assert delta["upserts"] == [] and delta["deletes"] == []
+    assert delta["order"] == ["Ivysaur", "Bulbasaur", "Venusaur", "Venusaur#2"]
+    assert apply_delta(OLD, delta) == new
+
+
+def test_unchanged_build_is_an_empty_delta():
+    delta = compute_delta(OLD, OLD)
+    assert (delta["upserts"], delta["deletes"], delta["order"]) == ([], [], None)
+    assert delta["from"] == delta["to"]
+    assert apply_delta(OLD, delta) == OLD
+
+
+def test_delta_against_another_base_is_refused():
+    delta = compute_delta(OLD, OLD[:2])
+    with pytest.raises(ValueError):
+        apply_delta(OLD[:3], delta)
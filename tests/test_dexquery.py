@@ -0,0 +1,19 @@
+from pokedex.dexquery import Pokedex
+
+
+ENTRIES = [
+    {"dex_number": 4, "name": "Charmander", "type": ["Fire"], "abilities": ["Blaze"], "gender": "87.5% male, 12.5% female", "speed": 65},
+    {"dex_number": 6, "name": "Charizard", "type": ["Fire", "Flying"], "abilities": ["Blaze"], "gender": "87.5% male, 12.5% female", "speed": 100},
+    {"dex_number": 479, "name": "Rotom", "type": ["Electric", "Ghost"], "abilities": ["Levitate"], "gender": "Genderless", "speed": 91},
+]
+
+
+def test_find_only_builds_the_indexes_it_uses():
+    dex = Pokedex(ENTRIES)
+    assert [entry["name"] for entry in dex.find(speed=(90, None))] == ["Charizard", "Rotom"]
+    for index_name in ("_by_type", "_by_ability", "_by_gender"):
+        assert index_name not in vars(dex)
+
+    assert [entry["name"] for entry in dex.find(type="fire", speed=(70, None))] == ["Charizard"]
+    assert "_by_type" in vars(dex)
+    assert "_by_ability" not in vars(dex) and "_by_gender" not in vars(dex)
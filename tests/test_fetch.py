@@ -0,0 +1,117 @@
+import asyncio
+
+import pytest
+import requests
+
+from pokedex import fetch
+from pokedex.fetch import AdaptiveLimit, AsyncFetcher, Fetcher, RetryPolicy
+from pokedex.transport import FetchError, Response
+
+
+URL = "https://pokemondb.net/pokedex/bulbasaur"
+
+
+class FakeTransport:
+    # Answers from a script of statuses (or exceptions), then 200s.
+    def __init__(self, script=(), headers=None):
+        self.script = list(script)
+        self.headers = headers or {}
+        self.sent = []
+
+    def send(self, url, headers=None):
+        self.sent.append(url)
+        answer = self.script.pop(0) if self.script else 200
+        if isinstance(answer, Exception):
+            raise answer
+        return Response(url, answer, b"page", dict(self.headers) if answer != 200 else {})
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(fetch.time, "sleep", delays.append)
+    return delays
+
+
+def test_retry_after_is_honoured(sleeps):
+    transport = FakeTransport([429, 503], headers={"retry-after": "7"})
+    response = Fetcher(transport=transport, retry=RetryPolicy(retries=4, backoff=0.5)).get(URL)
+    assert response.status_code == 200
+    assert sleeps == [7.0, 7.0]
+
+
+def test_retry_after_is_capped():
+    policy = RetryPolicy(retries=4, max_backoff=5.0)
+    assert policy.next_delay(0, Response(URL, 429, b"", {"retry-after": "120"})) == 5.0
+
+
+def test_jitter_stays_within_the_step():
+    policy = RetryPolicy(retries=10, backoff=0.5, max_backoff=3.0)
+    for attempt in range(10):
+        step = min(3.0, 0.5 * 2 ** attempt)
+        for _ in range(200):
+            delay = policy.next_delay(attempt, Response(URL, 503, b""))
+            assert step / 2 <= delay <= step
+
+
+def test_healthy_and_missing_pages_are_not_retried():
+    policy = RetryPolicy()
+    assert policy.next_delay(0, Response(URL, 200, b"")) is None
+    assert policy.next_delay(0, Response(URL, 404, b"")) is None
+
+
+def test_gives_up_after_retries(sleeps):
+    transport = FakeTransport([503] * 10)
+    response = Fetcher(transport=transport, retry=RetryPolicy(retries=3, backoff=0.01)).get(URL)
+    assert response.status_code == 503
+    assert len(transport.sent) == 4
+    assert len(sleeps) == 3
+
+
+def test_gives_up_on_errors_with_fetch_error(sleeps):
+    transport = FakeTransport([requests.ConnectionError("refused")] * 10)
+    with pytest.raises(FetchError):
+        Fetcher(transport=transport, retry=RetryPolicy(retries=2, backoff=0.01)).get(URL)
+    assert len(transport.sent) == 3
+
+
+def test_limit_halves_once_per_cooldown_and_grows_back(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(fetch.time, "monotonic", lambda: now[0])
+    limit = AdaptiveLimit(8, cooldown=1.0)
+    limit.record(throttled=True)
+    assert limit.limit == 4.0
+    # The same burst of 429s counts once.
+    limit.record(throttled=True)
+    assert limit.limit == 4.0
+    now[0] += 1.0
+    limit.record(throttled=True)
+    assert limit.limit == 2.0
+    limit.record(throttled=False)
+    assert limit.limit == 2.5
+    for _ in range(100):
+        limit.record(throttled=False)
+    assert limit.limit == 8.0
+
+
+def test_limit_never_drops_below_one(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(fetch.time, "monotonic", lambda: now[0])
+    limit = AdaptiveLimit(2, cooldown=1.0)
+    for _ in range(5):
+        limit.record(throttled=True)
+        now[0] += 1.0
+    assert limit.limit == 1.0
+
+
+@pytest.mark.parametrize("status", sorted(fetch.TRANSIENT_STATUSES))
+def test_async_fetcher_halves_on_transient_statuses(status):
+    transport = FakeTransport([status])
+    fetcher = AsyncFetcher(Fetcher(transport=transport, retry=RetryPolicy(retries=1, backoff=0.001)), concurrency=8, rate=0)
+    response = asyncio.run(fetcher.get(URL))
+    assert response.status_code == 200
+    # Halved by the transient answer, then raised by 1/4 for the 200.
+    assert fetcher.limit.limit == 4.25
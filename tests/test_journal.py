@@ -0,0 +1,44 @@
+import argparse
+
+from pokedex.extendedextractor import open_journal
+from pokedex.journal import Journal
+
+
+def write_journal(path, names, torn=False):
+    journal = Journal(str(path)).open()
+    for number, name in enumerate(names, 1):
+        journal.append(Journal.key(number, name), {"dex_number": number, "name": name, "details": {}})
+    journal.close()
+    if torn:
+        # A crash in the middle of the next append.
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"key": "3:Venusaur", "dex_num')
+
+
+def test_torn_last_line_is_skipped(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_journal(path, ["Bulbasaur", "Ivysaur"], torn=True)
+    journal = Journal(str(path))
+    assert journal.keys() == {"1:Bulbasaur", "2:Ivysaur"}
+    assert [record["name"] for record in journal] == ["Bulbasaur", "Ivysaur"]
+
+
+def test_resume_drops_torn_line_and_appends(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_journal(path, ["Bulbasaur", "Ivysaur"], torn=True)
+    journal, done_keys = open_journal(argparse.Namespace(journal=str(path), resume=True))
+    assert done_keys == {"1:Bulbasaur", "2:Ivysaur"}
+    journal.append(Journal.key(3, "Venusaur"), {"dex_number": 3, "name": "Venusaur", "details": {}})
+    journal.close()
+    with open(path, encoding="utf-8") as f:
+        assert len(f.readlines()) == 3
+    assert Journal(str(path)).keys() == {"1:Bulbasaur", "2:Ivysaur", "3:Venusaur"}
+
+
+def test_without_resume_starts_over(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    write_journal(path, ["Bulbasaur"])
+    journal, done_keys = open_journal(argparse.Namespace(journal=str(path), resume=False))
+    journal.close()
+    assert done_keys == set()
+    assert Journal(str(path)).keys() == set()
@@ -0,0 +1,58 @@
+import pytest
+
+from pokedex.itemdex import ItemIndex
+from pokedex.legality import LegalityEngine
+
+
+ITEMS = {
+    "Leftovers": {"Image": "//archives.bulbagarden.net/Bag_Leftovers_Sprite.png", "Generation": ["Gen9", "Gen8", "Gen3"]},
+    "Poke Ball": {"Image": "//archives.bulbagarden.net/Bag_Poke_Ball_Sprite.png", "Generation": ["Gen9", "Gen3"]},
+}
+
+ENTRIES = [
+    {
+        "dex_number": 1,
+        "name": "Bulbasaur",
+        "abilities": ["Overgrow", "Chlorophyll"],
+        "moves": {"Tackle": {"move": "Tackle", "generations": [1, 2, 3, 8, 9]}},
+    },
+]
+
+
+def make_engine():
+    return LegalityEngine.compile(ENTRIES, items=ItemIndex.from_items(ITEMS))
+
+
+def test_items_not_checked_before_item_data():
+    engine = make_engine()
+    for gen in (1, 2):
+        for item in ("Leftovers", "Poke Ball"):
+            assert engine.validate_set({"species": "Bulbasaur", "item": item, "moves": ["Tackle"]}, gen) == []
+
+
+def test_items_checked_where_item_data_exists():
+    engine = make_engine()
+    assert engine.validate_set({"species": "Bulbasaur", "item": "Leftovers", "moves": ["Tackle"]}, 8) == []
+    assert engine.validate_set({"species": "Bulbasaur", "item": "Poke Ball", "moves": ["Tackle"]}, 8) == ["Poke Ball is not available in generation 8"]
+    assert engine.validate_set({"species": "Bulbasaur", "item": "Master Ball", "moves": ["Tackle"]}, 2) == ["Master Ball is not a known item"]
+
+
+def test_raw_abilities_map_only_allows_own_form():
+    entries = [
+        {"dex_number": 479, "name": "Rotom", "abilities": {"Rotom": ["Levitate"], "Heat Rotom": ["Flash Fire"]}, "moves": {}},
+        {"dex_number": 479, "name": "Rotom-Heat", "form_name": "Heat Rotom", "abilities": {"Rotom": ["Levitate"], "Heat Rotom": ["Flash Fire"]}, "moves": {}},
+    ]
+    engine = LegalityEngine.compile(entries)
+    assert engine.has_ability("Rotom", "Levitate")
+    assert not engine.has_ability("Rotom", "Flash Fire")
+    assert engine.has_ability("Rotom-Heat", "Flash Fire")
+    assert not engine.has_ability("Rotom-Heat", "Levitate")
+
+
+def test_generation_out_of_range():
+    engine = make_engine()
+    for gen in (-1, 10):
+        assert engine.validate_set({"species": "Bulbasaur", "moves": ["Tackle"]}, gen) == [f"Generation {gen} is not between 1 and 9"]
+        with pytest.raises(ValueError):
+            engine.can_learn("Bulbasaur", "Tackle", gen)
+    assert engine.can_learn("Bulbasaur", "Tackle", 9)
@@ -0,0 +1,58 @@
+import json
+
+from pokedex.movecatalog import load_pokedex
+from pokedex.pipeline import fix_abilities, open_pipeline
+
+
+GROWL = {"level": 1, "move": "Growl", "type": "Normal", "power": None, "accuracy": 100, "generations": [1, 9]}
+
+ENTRIES = [
+    {
+        "dex_number": 479,
+        "name": "Rotom",
+        "abilities": {"Rotom": ["Levitate"], "Heat Rotom": ["Levitate"]},
+        "moves": {"Thunder Shock": {"level": 1, "move": "Thunder Shock", "type": "Electric", "power": 40, "accuracy": 100, "generations": [4, 9]}},
+    },
+    {
+        "dex_number": 479,
+        "name": "Rotom-Heat",
+        "form_name": "Heat Rotom",
+        "abilities": {"Rotom": ["Levitate"], "Heat Rotom": ["Levitate"]},
+        # An older move page with older numbers is kept as an override.
+        "moves": {"Thunder Shock": {"level": 1, "move": "Thunder Shock", "type": "Electric", "power": 30, "accuracy": 100, "generations": [4]}, "Growl": GROWL},
+    },
+    {"dex_number": 29, "name": "Nidoran♀", "abilities": ["Poison Point"], "moves": [GROWL]},
+]
+
+
+def test_one_pass_writes_every_output(tmp_path):
+    outputs = [(str(tmp_path / "pokedex.json"), "json"), (str(tmp_path / "minified.json"), "minified"), (str(tmp_path / "normalized.json"), "normalized")]
+    with open_pipeline(outputs, [fix_abilities]) as pipeline:
+        for entry in ENTRIES:
+            pipeline.write(entry)
+
+    fixed = [fix_abilities(entry) for entry in ENTRIES]
+    assert [entry["abilities"] for entry in fixed] == [["Levitate"], ["Levitate"], ["Poison Point"]]
+    with open(tmp_path / "pokedex.json") as f:
+        assert f.read() == json.dumps(fixed, indent=4)
+    with open(tmp_path / "minified.json") as f:
+        assert f.read() == json.dumps(fixed, separators=(',', ':'))
+    assert load_pokedex(str(tmp_path / "normalized.json")) == fixed
+
+
+def test_normalized_round_trip(tmp_path):
+    with open_pipeline([(str(tmp_path / "normalized.json"), "normalized")]) as pipeline:
+        for entry in ENTRIES:
+            pipeline.write(entry)
+    with open(tmp_path / "normalized.json") as f:
+        data = json.load(f)
+    assert set(data["moves"]) == {"thundershock", "growl"}
+    assert load_pokedex(str(tmp_path / "normalized.json")) == ENTRIES
+
+
+def test_dropping_stage(tmp_path):
+    keep_rotom = lambda entry: entry if entry["dex_number"] == 479 else None
+    with open_pipeline([(str(tmp_path / "out.ndjson"), "ndjson")], [keep_rotom]) as pipeline:
+        for entry in ENTRIES:
+            pipeline.write(entry)
+    assert [entry["name"] for entry in load_pokedex(str(tmp_path / "out.ndjson"))] == ["Rotom", "Rotom-Heat"]
@@ -0,0 +1,37 @@
+from pokedex.fetch import Fetcher, RetryPolicy
+from pokedex.transport import RecordingTransport, ReplayTransport, Response
+
+
+class ScriptedTransport:
+    # Answers each url from its own list of statuses; the last one repeats.
+    def __init__(self, scripts):
+        self.scripts = {url: list(statuses) for url, statuses in scripts.items()}
+
+    def send(self, url, headers=None):
+        statuses = self.scripts[url]
+        status = statuses.pop(0) if len(statuses) > 1 else statuses[0]
+        return Response(url, status, f"{status} {url}".encode(), {"content-type": "text/html"})
+
+    def close(self):
+        pass
+
+
+def test_replay_gives_back_the_answer_that_ended_the_retries(tmp_path, monkeypatch):
+    monkeypatch.setattr("pokedex.fetch.time.sleep", lambda delay: None)
+    urls = {
+        "https://pokemondb.net/pokedex/bulbasaur": [503, 200],
+        "https://pokemondb.net/pokedex/ivysaur": [429],
+        "https://pokemondb.net/pokedex/venusaur/moves/1": [404],
+    }
+    archive = str(tmp_path / "run.zip")
+    retry = RetryPolicy(retries=2, backoff=0)
+    recorder = Fetcher(transport=RecordingTransport(ScriptedTransport(urls), archive), retry=retry)
+    recorded = {url: recorder.get(url) for url in urls}
+    recorder.close()
+
+    replayer = Fetcher(transport=ReplayTransport(archive), retry=retry)
+    for url, response in recorded.items():
+        replayed = replayer.get(url)
+        assert (replayed.status_code, replayed.content) == (response.status_code, response.content)
+    replayer.close()
+    assert [recorded[url].status_code for url in urls] == [200, 429, 404]
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from pokedex.movecatalog import load_pokedex
+from pokedex.writer import open_writer
+
+
+ENTRIES = [
+    {
+        "dex_number": 29,
+        "name": "Nidoran♀",
+        "type": ["Poison"],
+        "abilities": {"Nidoran♀": ["Poison Point", "Rivalry"]},
+        "moves": {"Growl": {"level": 1, "move": "Growl", "type": "Normal", "power": None, "accuracy": 100, "generations": [1, 9]}},
+    },
+    {"dex_number": 669, "name": "Flabébé", "type": ["Fairy"], "abilities": [], "moves": {}},
+    {"dex_number": 0, "name": "Empty", "type": [], "evolutions": [], "nested": {"a": [{"b": {}}]}},
+]
+
+
+def write(path, format, entries, **kwargs):
+    with open_writer(str(path), format, **kwargs) as writer:
+        for entry in entries:
+            writer.write(entry)
+
+
+@pytest.mark.parametrize("entries", [ENTRIES, ENTRIES[:1], []])
+def test_json_is_identical_to_json_dump(tmp_path, entries):
+    write(tmp_path / "streamed.json", "json", entries)
+    with open(tmp_path / "dumped.json", "w") as f:
+        json.dump(entries, f, indent=4)
+    assert (tmp_path / "streamed.json").read_bytes() == (tmp_path / "dumped.json").read_bytes()
+
+
+@pytest.mark.parametrize("entries", [ENTRIES, ENTRIES[:1], []])
+def test_minified_is_identical_to_json_dump(tmp_path, entries):
+    write(tmp_path / "streamed.json", "minified", entries)
+    with open(tmp_path / "dumped.json", "w") as f:
+        json.dump(entries, f, separators=(',', ':'))
+    assert (tmp_path / "streamed.json").read_bytes() == (tmp_path / "dumped.json").read_bytes()
+
+
+def test_ndjson_has_one_entry_per_line(tmp_path):
+    write(tmp_path / "out.ndjson", "ndjson", ENTRIES)
+    lines = (tmp_path / "out.ndjson").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == ENTRIES
+    assert "Nidoran♀" in lines[0]
+    assert load_pokedex(str(tmp_path / "out.ndjson")) == ENTRIES
+
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        open_writer("out.json", "yaml")